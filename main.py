@@ -4,7 +4,6 @@ import sys
 
 from loguru import logger
 
-from src.app import App
 from src.config.logger import setup_logger
 from src.constants.path import Directories
 
@@ -20,6 +19,9 @@ def main() -> None:
     setup_logger()
     logger.info("Запуск приложения Take Break")
 
+    # Qt и виджеты импортируются после настройки логгера
+    from src.app import App  # noqa: PLC0415
+
     app = App()
     try:
         app.run()
@@ -29,9 +31,7 @@ def main() -> None:
     except Exception as e:
         logger.exception(f"Неожиданная ошибка: {e}")
     finally:
-        import keyboard
-
-        keyboard.unhook_all()
+        app.remove_hotkeys()
         logger.info("Завершение работы приложения")
         sys.exit(0)
 
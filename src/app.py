@@ -2,10 +2,12 @@
 
 import sys
 from datetime import UTC, datetime
+from functools import cached_property
+from types import ModuleType
 
-import keyboard
 from loguru import logger
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, QPoint, QRect, Qt, QTimer, Signal
+from PySide6.QtGui import QScreen
 from PySide6.QtWidgets import QApplication, QDialog
 
 from src.config import texts
@@ -13,6 +15,7 @@ from src.config.settings import Settings
 from src.constants.settings import (
     BREAK_DURATION_MIN,
     MOVE_TIMER_HOTKEY,
+    MS_IN_MINUTE,
     POMODORO_MODE_MIN,
     TIMER_INTERVAL_MS,
 )
@@ -27,7 +30,16 @@ from src.services.timer import TimerManager
 from src.widgets.overlay import BlockingOverlay
 from src.widgets.timer import TimerWidget
 from src.widgets.tray import SystemTray
-from src.widgets.welcome import WelcomeDialog
+
+
+class _HotkeyBridge(QObject):
+    """Передаёт срабатывания глобальных хоткеев в GUI-поток.
+
+    Колбэки keyboard вызываются в потоке хука ОС, где трогать виджеты нельзя.
+    Колбэк только испускает сигнал, а слот выполняется в цикле событий Qt.
+    """
+
+    move_timer_requested = Signal()
 
 
 class App:
@@ -52,14 +64,31 @@ class App:
         self.timer_manager = TimerManager()
         self.settings = Settings(db=Database())
 
-        self.timer_widget = TimerWidget()
         self.tray = SystemTray()
 
         self.current_position = WidgetPosition.TOP_RIGHT
 
+        self._screen: QScreen | None = None
+        self._screen_geometry: QRect | None = None
+        self._position_cache: dict[tuple[WidgetPosition, int, int], QPoint] = {}
+        if screen := self.app.primaryScreen():
+            self._on_primary_screen_changed(screen)
+        self.app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+
         self.timer = QTimer()
+        # Тики идут от старта таймера, то есть сразу после смены отображаемой секунды.
+        # Грубый таймер может сработать раньше на 5% и показать ту же секунду дважды
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self._on_timer_timeout)
 
+        self._work_end_timer = QTimer()
+        self._work_end_timer.setSingleShot(True)
+        self._work_end_timer.timeout.connect(self._on_work_expired)
+
+        self._break_end_timer = QTimer()
+        self._break_end_timer.setSingleShot(True)
+        self._break_end_timer.timeout.connect(self._on_break_expired)
+
         self.focus_text = self.settings.get_focus()
         self.work_duration = self.settings.get_work_duration()
 
@@ -68,11 +97,12 @@ class App:
         self.overlay.close_requested.connect(self.quit)
         self.overlay.enter_pressed.connect(self._on_enter_pressed)
 
+        self._keyboard: ModuleType | None = None
         self._setup_hotkeys()
         self._setup_tray()
 
         use_online = self.settings.get_use_online_wallpapers()
-        self.overlay.wallpaper_manager.set_use_online(use_online)
+        self.overlay.set_use_online_wallpapers(use_online)
         self.tray.set_online_wallpapers_enabled(use_online)
 
         if self.settings.is_first_run():
@@ -83,13 +113,39 @@ class App:
 
         logger.info("Приложение инициализировано и готово к работе")
 
+    @cached_property
+    def timer_widget(self) -> TimerWidget:
+        """Виджет таймера, создаётся при первом обращении.
+
+        До первого рабочего цикла он не нужен, поэтому не строится при запуске.
+
+        Returns:
+            Виджет таймера.
+
+        """
+        return TimerWidget()
+
     def _setup_hotkeys(self) -> None:
         """Настроить глобальные хоткеи приложения."""
+        import keyboard  # noqa: PLC0415
+
         hotkey = self.settings.get_move_timer_hotkey()
         if not hotkey:
             hotkey = MOVE_TIMER_HOTKEY
             self.settings.set_move_timer_hotkey(hotkey)
-        keyboard.add_hotkey(hotkey, self._move_timer)
+        self._hotkey_bridge = _HotkeyBridge()
+        self._hotkey_bridge.move_timer_requested.connect(
+            self._move_timer,
+            Qt.ConnectionType.QueuedConnection,
+        )
+        keyboard.add_hotkey(hotkey, self._hotkey_bridge.move_timer_requested.emit)
+        self._keyboard = keyboard
+
+    def remove_hotkeys(self) -> None:
+        """Снять глобальные хоткеи, если они были зарегистрированы."""
+        if self._keyboard is not None:
+            self._keyboard.unhook_all()
+            self._keyboard = None
 
     def _setup_tray(self) -> None:
         """Настроить сигналы системного трея и начальное состояние."""
@@ -105,6 +161,8 @@ class App:
 
     def _show_welcome_dialog(self) -> None:
         """Показать диалог приветствия при первом запуске."""
+        from src.widgets.welcome import WelcomeDialog  # noqa: PLC0415
+
         dialog = WelcomeDialog()
         result = dialog.exec()
 
@@ -114,11 +172,8 @@ class App:
             sys.exit(0)
 
         selected_duration = dialog.get_selected_work_duration()
-        self.settings.set_work_duration(selected_duration)
-        self.work_duration = selected_duration
-        self.tray.set_work_mode(selected_duration)
-
-        self.settings.mark_first_run_complete()
+        self.work_duration = self.settings.complete_first_run(selected_duration)
+        self.tray.set_work_mode(self.work_duration)
         logger.info("Диалог приветствия принят, первый запуск отмечен")
 
     def _on_autostart_toggle(self, enabled: bool) -> None:
@@ -142,7 +197,7 @@ class App:
 
         """
         self.settings.set_use_online_wallpapers(enabled)
-        self.overlay.wallpaper_manager.set_use_online(enabled)
+        self.overlay.set_use_online_wallpapers(enabled)
         logger.info(f"Онлайн-обои переключены: {enabled}")
 
     def _on_work_mode_changed(self, duration: int) -> None:
@@ -180,26 +235,53 @@ class App:
         self._reposition_timer()
         logger.debug(f"Таймер перемещён: {self.current_position.name}")
 
+    def _on_primary_screen_changed(self, screen: QScreen) -> None:
+        """Подписаться на изменения геометрии нового основного экрана.
+
+        Args:
+            screen: Новый основной экран.
+
+        """
+        if self._screen is not None:
+            self._screen.availableGeometryChanged.disconnect(self._on_screen_geometry_changed)
+        self._screen = screen
+        screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
+        self._on_screen_geometry_changed(screen.availableGeometry())
+
+    def _on_screen_geometry_changed(self, geometry: QRect) -> None:
+        """Обновить закэшированную доступную геометрию экрана.
+
+        Args:
+            geometry: Доступная геометрия основного экрана.
+
+        """
+        self._screen_geometry = geometry
+        self._position_cache.clear()
+
     def _reposition_timer(self) -> None:
         """Разместить виджет таймера на экране."""
-        if not (screen := self.app.primaryScreen()):
+        if (screen_geometry := self._screen_geometry) is None:
             return
 
-        screen_geometry = screen.availableGeometry()
         widget_size = self.timer_widget.size()
-
-        position = calculate_position(
-            self.current_position,
-            screen_geometry.width(),
-            screen_geometry.height(),
-            widget_size.width(),
-            widget_size.height(),
-        )
-
-        x = screen_geometry.x() + position.x()
-        y = screen_geometry.y() + position.y()
-
-        self.timer_widget.move(x, y)
+        key = (self.current_position, widget_size.width(), widget_size.height())
+
+        # Позиции кэшируются до смены геометрии экрана
+        target = self._position_cache.get(key)
+        if target is None:
+            position = calculate_position(
+                self.current_position,
+                screen_geometry.width(),
+                screen_geometry.height(),
+                widget_size.width(),
+                widget_size.height(),
+            )
+            target = position + screen_geometry.topLeft()
+            self._position_cache[key] = target
+
+        # Не трогать окно, если оно уже на месте
+        if self.timer_widget.pos() != target:
+            self.timer_widget.move(target)
 
     def show_initial_overlay(self) -> None:
         """Показать начальный overlay для выбора рабочего режима."""
@@ -245,6 +327,7 @@ class App:
         self._extra_rest_start = None
 
         self.timer_manager.start_work(self.work_duration)
+        self._work_end_timer.start(self.work_duration * MS_IN_MINUTE)
         self.timer_widget.set_focus_text(self.focus_text)
         self.timer_widget.show()
 
@@ -256,7 +339,9 @@ class App:
 
     def start_break_timer(self) -> None:
         """Запустить таймер перерыва."""
+        self._work_end_timer.stop()
         self.timer_manager.start_break()
+        self._break_end_timer.start(self.timer_manager.break_duration * MS_IN_MINUTE)
         self.overlay.is_blocking = True
         self.overlay.hide_focus_input()
         self.overlay.hide_extra_rest_timer()
@@ -266,25 +351,29 @@ class App:
         logger.info(f"Перерыв начат на {BREAK_DURATION_MIN} минут")
 
     def _on_timer_timeout(self) -> None:
-        """Обновить UI на основе состояния таймера."""
-        if self.timer_manager.is_work_expired():
-            logger.debug("Рабочее время истекло")
-            self.start_break_timer()
-        elif self.timer_manager.is_work_active():
-            remaining = self.timer_manager.get_work_remaining()
-            if remaining:
-                self.timer_widget.update_time(remaining)
-
-        if self.timer_manager.is_break_expired():
-            logger.debug("Перерыв истёк")
-            self.end_break()
-        elif self.timer_manager.is_break_active():
-            remaining = self.timer_manager.get_break_remaining()
-            if remaining:
-                self.overlay.update_time(remaining)
+        """Обновить отображение оставшегося времени.
+
+        Окончание работы и перерыва отслеживают одноразовые таймеры,
+        здесь только перерисовка обратного отсчёта.
+        """
+        if (remaining := self.timer_manager.get_work_remaining()) is not None:
+            self.timer_widget.update_time(remaining)
+        elif (remaining := self.timer_manager.get_break_remaining()) is not None:
+            self.overlay.update_time(remaining)
+
+    def _on_work_expired(self) -> None:
+        """Обработать окончание рабочего времени."""
+        logger.debug("Рабочее время истекло")
+        self.start_break_timer()
+
+    def _on_break_expired(self) -> None:
+        """Обработать окончание перерыва."""
+        logger.debug("Перерыв истёк")
+        self.end_break()
 
     def end_break(self) -> None:
         """Завершить перерыв и вернуться в начальное состояние."""
+        self._break_end_timer.stop()
         self.timer_manager.end_break()
         self._extra_rest_start = datetime.now(UTC)
 
@@ -301,12 +390,12 @@ class App:
     def quit(self) -> None:
         """Выйти из приложения.
 
-        Блокирует выход во время активного перерыва.
+        Блокирует выход во время активного перерыва. Хуки клавиатуры
+        снимаются в main() после выхода из цикла событий.
         """
         if self.timer_manager.is_break_active():
             logger.warning("Нельзя выйти во время перерыва")
             return
-        keyboard.unhook_all()
         self.app.quit()
 
     def run(self) -> int:
@@ -1,5 +1,7 @@
 """Хранилище настроек приложения."""
 
+from typing import Final
+
 from loguru import logger
 
 from src.constants.settings import (
@@ -10,9 +12,21 @@ from src.constants.settings import (
 from src.db.db import Database
 from src.schemas.settings import SettingsKey
 
+# Ключи как простые str для горячего пути get/set
+_FOCUS_KEY: Final = SettingsKey.FOCUS.value
+_FIRST_RUN_COMPLETE_KEY: Final = SettingsKey.FIRST_RUN_COMPLETE.value
+_USE_ONLINE_WALLPAPERS_KEY: Final = SettingsKey.USE_ONLINE_WALLPAPERS.value
+_WORK_DURATION_KEY: Final = SettingsKey.WORK_DURATION.value
+_MOVE_TIMER_HOTKEY_KEY: Final = SettingsKey.MOVE_TIMER_HOTKEY.value
+_LOAD_IMAGE_TIMEOUT_KEY: Final = SettingsKey.LOAD_IMAGE_TIMEOUT.value
+
 
 class Settings:
-    """Управление постоянными настройками через SQLite."""
+    """Управление постоянными настройками через SQLite.
+
+    Все значения читаются из базы одним запросом при инициализации,
+    дальше геттеры обслуживаются из кэша Database.
+    """
 
     def __init__(self, db: Database) -> None:
         """Инициализировать хранилище настроек.
@@ -23,21 +37,21 @@ class Settings:
         """
         self.db = db
         self._ensure_defaults()
+        # Прогреть кэш Database одним запросом
+        self.db.get_all()
 
     def _ensure_defaults(self) -> None:
         """Заполнить значения по умолчанию если их нет в базе."""
         defaults: dict[str, str | int | bool] = {
-            SettingsKey.FOCUS: "",
-            SettingsKey.FIRST_RUN_COMPLETE: "false",
-            SettingsKey.USE_ONLINE_WALLPAPERS: "true",
-            SettingsKey.WORK_DURATION: str(DEFAULT_WORK_DURATION_MIN),
-            SettingsKey.MOVE_TIMER_HOTKEY: "",
-            SettingsKey.LOAD_IMAGE_TIMEOUT: str(LOAD_IMAGE_TIMEOUT_DEFAULT),
+            _FOCUS_KEY: "",
+            _FIRST_RUN_COMPLETE_KEY: False,
+            _USE_ONLINE_WALLPAPERS_KEY: True,
+            _WORK_DURATION_KEY: str(DEFAULT_WORK_DURATION_MIN),
+            _MOVE_TIMER_HOTKEY_KEY: "",
+            _LOAD_IMAGE_TIMEOUT_KEY: str(LOAD_IMAGE_TIMEOUT_DEFAULT),
         }
 
-        for key, value in defaults.items():
-            if self.db.get(key) is None:
-                self.db.set(key, value=value)
+        self.db.set_defaults(defaults)
 
     def get_focus(self) -> str:
         """Получить сохранённый фокус.
@@ -46,7 +60,7 @@ class Settings:
             Сохранённый фокус или пустая строка.
 
         """
-        return self.db.get(SettingsKey.FOCUS, "") or ""
+        return self.db.get(_FOCUS_KEY, "") or ""
 
     def save_focus(self, focus: str) -> None:
         """Сохранить фокус.
@@ -55,7 +69,7 @@ class Settings:
             focus: Текст фокуса для сохранения.
 
         """
-        self.db.set(SettingsKey.FOCUS, value=focus)
+        self.db.set(_FOCUS_KEY, value=focus)
         logger.debug(f"Фокус сохранён: {focus}")
 
     def is_first_run(self) -> bool:
@@ -65,11 +79,11 @@ class Settings:
             True если первый запуск, False иначе.
 
         """
-        return not self.db.get_bool(SettingsKey.FIRST_RUN_COMPLETE, default=False)
+        return not self.db.get_bool(_FIRST_RUN_COMPLETE_KEY, default=False)
 
     def mark_first_run_complete(self) -> None:
         """Отметить первый запуск как завершённый."""
-        self.db.set(SettingsKey.FIRST_RUN_COMPLETE, value=True)
+        self.db.set(_FIRST_RUN_COMPLETE_KEY, value=True)
         logger.debug("Первый запуск отмечен как завершённый")
 
     def get_use_online_wallpapers(self) -> bool:
@@ -79,7 +93,7 @@ class Settings:
             Использовать ли онлайн-обои.
 
         """
-        return self.db.get_bool(SettingsKey.USE_ONLINE_WALLPAPERS, default=True)
+        return self.db.get_bool(_USE_ONLINE_WALLPAPERS_KEY, default=True)
 
     def set_use_online_wallpapers(self, enabled: bool) -> None:
         """Установить настройку онлайн-обоев.
@@ -88,7 +102,7 @@ class Settings:
             enabled: Включить ли онлайн-обои.
 
         """
-        self.db.set(SettingsKey.USE_ONLINE_WALLPAPERS, value=enabled)
+        self.db.set(_USE_ONLINE_WALLPAPERS_KEY, value=enabled)
         logger.debug(f"Онлайн-обои: {enabled}")
 
     def get_work_duration(self) -> int:
@@ -98,7 +112,7 @@ class Settings:
             Длительность в минутах (25 или 45).
 
         """
-        return self.db.get_int(SettingsKey.WORK_DURATION, DEFAULT_WORK_DURATION_MIN)
+        return self.db.get_int(_WORK_DURATION_KEY, DEFAULT_WORK_DURATION_MIN)
 
     def set_work_duration(self, duration: int) -> None:
         """Установить длительность рабочего режима.
@@ -106,15 +120,48 @@ class Settings:
         Args:
             duration: Длительность в минутах (25 или 45).
 
+        """
+        duration = self._validate_work_duration(duration)
+        self.db.set(_WORK_DURATION_KEY, value=duration)
+        logger.debug(f"Длительность работы: {duration} минут")
+
+    def complete_first_run(self, work_duration: int) -> int:
+        """Сохранить выбранный режим и отметить первый запуск одной транзакцией.
+
+        Args:
+            work_duration: Выбранная длительность в минутах (25 или 45).
+
+        Returns:
+            Сохранённая длительность после проверки.
+
+        """
+        duration = self._validate_work_duration(work_duration)
+        self.db.set_many(
+            {
+                _WORK_DURATION_KEY: duration,
+                _FIRST_RUN_COMPLETE_KEY: True,
+            },
+        )
+        logger.debug(f"Первый запуск завершён, длительность работы: {duration} минут")
+        return duration
+
+    @staticmethod
+    def _validate_work_duration(duration: int) -> int:
+        """Проверить длительность рабочего режима.
+
+        Args:
+            duration: Длительность в минутах.
+
+        Returns:
+            Переданная длительность или значение по умолчанию, если она некорректна.
+
         """
         if duration not in AVAILABLE_WORK_MODES:
             logger.warning(
                 f"Некорректная длительность: {duration}, использую {DEFAULT_WORK_DURATION_MIN}"
             )
-            duration = DEFAULT_WORK_DURATION_MIN
-
-        self.db.set(SettingsKey.WORK_DURATION, value=duration)
-        logger.debug(f"Длительность работы: {duration} минут")
+            return DEFAULT_WORK_DURATION_MIN
+        return duration
 
     def get_move_timer_hotkey(self) -> str:
         """Получить хоткей перемещения таймера.
@@ -123,7 +170,7 @@ class Settings:
             Сохранённый хоткей или пустая строка.
 
         """
-        return self.db.get(SettingsKey.MOVE_TIMER_HOTKEY, "") or ""
+        return self.db.get(_MOVE_TIMER_HOTKEY_KEY, "") or ""
 
     def set_move_timer_hotkey(self, hotkey: str) -> None:
         """Сохранить хоткей перемещения таймера.
@@ -132,7 +179,7 @@ class Settings:
             hotkey: Хоткей (например, "ctrl+alt+t").
 
         """
-        self.db.set(SettingsKey.MOVE_TIMER_HOTKEY, value=hotkey)
+        self.db.set(_MOVE_TIMER_HOTKEY_KEY, value=hotkey)
         logger.debug(f"Хоткей перемещения таймера: {hotkey}")
 
     def get_load_image_timeout(self) -> int:
@@ -142,7 +189,7 @@ class Settings:
             Таймаут в секундах.
 
         """
-        return self.db.get_int(SettingsKey.LOAD_IMAGE_TIMEOUT, LOAD_IMAGE_TIMEOUT_DEFAULT)
+        return self.db.get_int(_LOAD_IMAGE_TIMEOUT_KEY, LOAD_IMAGE_TIMEOUT_DEFAULT)
 
     def set_load_image_timeout(self, timeout: int) -> None:
         """Установить таймаут загрузки изображений.
@@ -151,5 +198,5 @@ class Settings:
             timeout: Таймаут в секундах.
 
         """
-        self.db.set(SettingsKey.LOAD_IMAGE_TIMEOUT, value=timeout)
+        self.db.set(_LOAD_IMAGE_TIMEOUT_KEY, value=timeout)
         logger.debug(f"Таймаут загрузки изображений: {timeout} сек")
@@ -1,6 +1,87 @@
 """Text constants for all application messages and UI elements."""
 
-from src.constants.settings import BREAK_DURATION_MIN, DEFAULT_WORK_DURATION_MIN
+from functools import lru_cache
+
+from src.constants.settings import (
+    AVAILABLE_WORK_MODES,
+    BREAK_DURATION_MIN,
+    DEFAULT_WORK_DURATION_MIN,
+)
+
+_DESCRIPTION_HTML = """
+        <div style='background-color: white; padding: 20px; border-radius: 8px; box-sizing: border-box;'>
+            <p style='font-size: 15px; line-height: 1.8; margin: 0 0 10px 0; color: #34495e;'>
+                <b style='color: #2c3e50; font-size: 16px;'>
+                    Ключевые принципы Take Break:
+                </b>
+            </p>
+            <ul style='font-size: 14px; color: #34495e; margin: 0; padding: 0 0 0 20px; list-style-type: disc; line-height: 1.5;'>
+                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
+                    <b>Определяйте фокус:</b> Устанавливайте ключевую задачу на следующую сессию, чтобы возвращаться к работе было легко.
+                </li>
+                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
+                    <b>Работайте строго, отдыхайте свободно:</b> Таймер работы неотвратим, но после обязательного 5-минутного перерыва он будет ждать вашего возвращения.
+                </li>
+                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
+                    <b>Отдыхайте красиво:</b> Наслаждайтесь новыми фоновыми заставками во время каждого перерыва.
+                </li>
+                <li style='margin: 0; padding: 0; line-height: 1;'>
+                    <b>Вы контролируете ситуацию:</b> Выход из приложения доступен в любой момент до начала перерыва.
+                </li>
+            </ul>
+        </div>
+        """  # noqa: E501
+
+_BREAK_MESSAGE = f"Отдых: {BREAK_DURATION_MIN} минут"
+
+
+def _render_initial_text(duration: int) -> str:
+    """Build the initial overlay text without a previous focus.
+
+    Args:
+        duration: The work duration in minutes.
+
+    Returns:
+        Initial overlay message with HTML formatting.
+
+    """
+    return (
+        f"<div style='text-align: center;'>"
+        f"<p style='font-size: 24px; margin-bottom: 40px; line-height: 1.4;'>"
+        f"<span style='font-size: 36px;'>⏱️</span><br/>"
+        f"Нажмите <b style='color: #00ff88;'>Enter</b>, чтобы начать<br/>"
+        f"<span style='color: #00d4ff; font-size: 28px;'>"
+        f"{duration}-минутный</span> рабочий сеанс</p></div>"
+    )
+
+
+@lru_cache(maxsize=8)
+def _render_focus_text(previous_focus: str) -> str:
+    """Build the initial overlay text for a previous focus.
+
+    Args:
+        previous_focus: The previous focus text.
+
+    Returns:
+        Initial overlay message with HTML formatting.
+
+    """
+    return (
+        f"<div style='text-align: center;'>"
+        f"<p style='font-size: 24px; margin-bottom: 40px; line-height: 1.4;'>"
+        f"<span style='color: #ffd700; font-size: 28px;'>🎯</span> "
+        f"<b>Ваш предыдущий фокус:</b><br/>"
+        f"<span style='color: #00d4ff; font-size: 28px;'>{previous_focus}</span>"
+        f"</p>"
+        f"<p style='font-size: 16px; line-height: 2.2; color: rgba(255,255,255,0.9);'>"
+        f"✨ Нажмите <b style='color: #00ff88;'>Enter</b> для продолжения "
+        f"или измените фокус</p></div>"
+    )
+
+
+_INITIAL_TEXT_BY_DURATION = {
+    duration: _render_initial_text(duration) for duration in AVAILABLE_WORK_MODES
+}
 
 
 class AppInfo:
@@ -30,29 +111,7 @@ class WelcomeDialogTexts:
             HTML formatted description text.
 
         """
-        return """
-        <div style='background-color: white; padding: 20px; border-radius: 8px; box-sizing: border-box;'>
-            <p style='font-size: 15px; line-height: 1.8; margin: 0 0 10px 0; color: #34495e;'>
-                <b style='color: #2c3e50; font-size: 16px;'>
-                    Ключевые принципы Take Break:
-                </b>
-            </p>
-            <ul style='font-size: 14px; color: #34495e; margin: 0; padding: 0 0 0 20px; list-style-type: disc; line-height: 1.5;'>
-                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
-                    <b>Определяйте фокус:</b> Устанавливайте ключевую задачу на следующую сессию, чтобы возвращаться к работе было легко.
-                </li>
-                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
-                    <b>Работайте строго, отдыхайте свободно:</b> Таймер работы неотвратим, но после обязательного 5-минутного перерыва он будет ждать вашего возвращения.
-                </li>
-                <li style='margin: 0 0 10px 0; padding: 0; line-height: 1;'>
-                    <b>Отдыхайте красиво:</b> Наслаждайтесь новыми фоновыми заставками во время каждого перерыва.
-                </li>
-                <li style='margin: 0; padding: 0; line-height: 1;'>
-                    <b>Вы контролируете ситуацию:</b> Выход из приложения доступен в любой момент до начала перерыва.
-                </li>
-            </ul>
-        </div>
-        """  # noqa: E501
+        return _DESCRIPTION_HTML
 
     @property
     def checkbox_online(self) -> str:
@@ -69,6 +128,7 @@ class Overlay:
     """Overlay window texts."""
 
     PLACEHOLDER = "✨ Введите ваш фокус на следующую сессию..."
+    EXTRA_REST_PREFIX = "☕ Дополнительный отдых: +"
 
     @staticmethod
     def get_initial_text(
@@ -77,6 +137,9 @@ class Overlay:
     ) -> str:
         """Get the initial overlay text.
 
+        Texts for the known work modes are built once at import,
+        the focus variant is cached per focus text.
+
         Args:
             previous_focus: The previous focus text, if any.
             work_duration: The selected work duration in minutes.
@@ -85,28 +148,13 @@ class Overlay:
             Initial overlay message with HTML formatting.
 
         """
+        if previous_focus:
+            return _render_focus_text(previous_focus)
+
         # If work_duration not provided, use default
         duration = work_duration if work_duration is not None else DEFAULT_WORK_DURATION_MIN
-        if previous_focus:
-            return (
-                f"<div style='text-align: center;'>"
-                f"<p style='font-size: 24px; margin-bottom: 40px; line-height: 1.4;'>"
-                f"<span style='color: #ffd700; font-size: 28px;'>🎯</span> "
-                f"<b>Ваш предыдущий фокус:</b><br/>"
-                f"<span style='color: #00d4ff; font-size: 28px;'>{previous_focus}</span>"
-                f"</p>"
-                f"<p style='font-size: 16px; line-height: 2.2; color: rgba(255,255,255,0.9);'>"
-                f"✨ Нажмите <b style='color: #00ff88;'>Enter</b> для продолжения "
-                f"или измените фокус</p></div>"
-            )
-        return (
-            f"<div style='text-align: center;'>"
-            f"<p style='font-size: 24px; margin-bottom: 40px; line-height: 1.4;'>"
-            f"<span style='font-size: 36px;'>⏱️</span><br/>"
-            f"Нажмите <b style='color: #00ff88;'>Enter</b>, чтобы начать<br/>"
-            f"<span style='color: #00d4ff; font-size: 28px;'>"
-            f"{duration}-минутный</span> рабочий сеанс</p></div>"
-        )
+        text = _INITIAL_TEXT_BY_DURATION.get(duration)
+        return text if text is not None else _render_initial_text(duration)
 
     @staticmethod
     def break_message() -> str:
@@ -116,7 +164,7 @@ class Overlay:
             Текст сообщения о перерыве.
 
         """
-        return f"Отдых: {BREAK_DURATION_MIN} минут"
+        return _BREAK_MESSAGE
 
 
 class WorkModes:
@@ -1,9 +1,14 @@
 """Константы путей приложения."""
 
 import sys
+from functools import cache
 from pathlib import Path
+from typing import Final
 
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+
+@cache
 def get_base_dir() -> Path:
     """Получить директорию пользовательских данных (read-write).
 
@@ -14,9 +19,10 @@ def get_base_dir() -> Path:
     """
     if getattr(sys, "frozen", False):
         return Path(sys.executable).parent
-    return Path(__file__).parent.parent.parent
+    return _PROJECT_ROOT
 
 
+@cache
 def get_bundle_dir() -> Path:
     """Получить директорию упакованных ресурсов (read-only).
 
@@ -27,7 +33,17 @@ def get_bundle_dir() -> Path:
     """
     if getattr(sys, "frozen", False):
         return Path(sys._MEIPASS)  # type: ignore[attr-defined]
-    return Path(__file__).parent.parent.parent
+    return _PROJECT_ROOT
+
+
+# Имена, а не сами пути: make_dirs читает актуальные значения атрибутов класса
+_ALL_DIR_NAMES: Final = (
+    "LOGS_DIR",
+    "CACHE_DIR",
+    "SETTINGS_DIR",
+    "LOGO_DIR",
+    "WALLPAPERS_DIR",
+)
 
 
 class Directories:
@@ -44,10 +60,14 @@ class Directories:
     WALLPAPERS_DIR: Path = get_bundle_dir() / "app_data" / "wallpapers"
 
     def make_dirs(self) -> None:
-        """Создать все необходимые директории пользователя."""
-        for value in vars(type(self)).values():
-            if isinstance(value, Path):
-                value.mkdir(parents=True, exist_ok=True)
+        """Создать все необходимые директории пользователя.
+
+        Отсутствующие директории создаются, существующие не трогаются.
+        """
+        for name in _ALL_DIR_NAMES:
+            path: Path = getattr(self, name)
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
 
 
 class Files:
@@ -7,6 +7,7 @@ DEFAULT_WORK_DURATION_MIN = STANDARD_MODE_MIN
 AVAILABLE_WORK_MODES = [POMODORO_MODE_MIN, STANDARD_MODE_MIN]
 BREAK_DURATION_MIN = 5
 TIMER_INTERVAL_MS = 1000
+MS_IN_MINUTE = 60_000
 
 # --- Hotkeys ---
 MOVE_TIMER_HOTKEY = "ctrl+alt+t"
@@ -2,12 +2,94 @@
 
 import contextlib
 import sqlite3
+import threading
+from collections.abc import Mapping
 from pathlib import Path
 
 from loguru import logger
 
 from src.constants.path import Files
 
+# SQL держим константами: sqlite3 кэширует подготовленные выражения по тексту запроса
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+"""
+_SELECT_SQL = "SELECT value FROM settings WHERE key=?"
+_SELECT_ALL_SQL = "SELECT key, value FROM settings"
+_UPSERT_SQL = """
+    INSERT INTO settings (key, value)
+    VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value=excluded.value
+"""
+_INSERT_DEFAULT_SQL = "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)"
+
+_FILE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+_COMMON_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+# Старые версии хранили булевы значения как "true"/"True"
+_TRUE_VALUES = frozenset({"1", "true", "True"})
+
+
+def to_db_value(value: str | int | bool) -> str:
+    """Преобразовать значение настройки в строку для хранения.
+
+    Args:
+        value: Значение настройки.
+
+    Returns:
+        Строковое представление; булевы значения хранятся как "1"/"0".
+
+    """
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+def to_bool(value: str | None, default: bool = False) -> bool:
+    """Преобразовать сохранённое значение в bool.
+
+    Args:
+        value: Строковое значение из базы или None.
+        default: Значение по умолчанию если value is None.
+
+    Returns:
+        Булево значение.
+
+    """
+    if value is None:
+        return default
+    return value in _TRUE_VALUES
+
+
+def to_int(value: str | None, default: int = 0) -> int:
+    """Преобразовать сохранённое значение в int.
+
+    Args:
+        value: Строковое значение из базы или None.
+        default: Значение по умолчанию если value is None или некорректно.
+
+    Returns:
+        Целочисленное значение.
+
+    """
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Не удалось преобразовать '{value}' в int: {e}")
+        return default
+
 
 class Database:
     """SQLite база данных в формате ключ-значение."""
@@ -15,6 +97,11 @@ class Database:
     def __init__(self, db_path: Path | str | None = None) -> None:
         """Инициализировать базу данных.
 
+        Соединение открывается один раз на время жизни объекта и работает
+        в режиме autocommit: каждая одиночная запись сразу фиксируется
+        без отдельного вызова commit(). Обращения из разных потоков
+        сериализуются блокировкой.
+
         Args:
             db_path: Путь к файлу базы данных.
                     По умолчанию использует Files.SETTINGS_DB_PATH.
@@ -24,25 +111,33 @@ class Database:
         if db_path is None:
             db_path = Files.SETTINGS_DB_PATH
         self.db_path = db_path
-        if str(db_path) != ":memory:":
+        if str(db_path) != Files.MEMORY_DB_PATH:
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._connection: sqlite3.Connection = sqlite3.connect(
             str(db_path),
             check_same_thread=False,
+            isolation_level=None,
         )
+        self._lock = threading.Lock()
+        self._cache: dict[str, str | None] = {}
+        self._apply_pragmas()
         self._init_db()
 
+    def _apply_pragmas(self) -> None:
+        """Настроить соединение.
+
+        Для файловой базы WAL и synchronous=NORMAL убирают лишний fsync
+        на каждую запись; busy_timeout ждёт блокировку вместо SQLITE_BUSY.
+        """
+        pragmas = _COMMON_PRAGMAS
+        if str(self.db_path) != Files.MEMORY_DB_PATH:
+            pragmas = _FILE_PRAGMAS + pragmas
+        for pragma in pragmas:
+            self._connection.execute(pragma)
+
     def _init_db(self) -> None:
         """Создать таблицу настроек если не существует."""
-        self._connection.execute(
-            """
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            """,
-        )
-        self._connection.commit()
+        self._connection.execute(_CREATE_TABLE_SQL)
 
     def get(self, key: str, default: str | None = None) -> str | None:
         """Получить значение настройки.
@@ -55,11 +150,25 @@ class Database:
             Значение настройки или default.
 
         """
-        result = self._connection.execute(
-            "SELECT value FROM settings WHERE key=?",
-            (key,),
-        ).fetchone()
-        return result[0] if result else default
+        with self._lock:
+            if key in self._cache:
+                value = self._cache[key]
+            else:
+                result = self._connection.execute(_SELECT_SQL, (key,)).fetchone()
+                value = self._cache[key] = result[0] if result else None
+        return default if value is None else value
+
+    def get_all(self) -> dict[str, str]:
+        """Получить все настройки одним запросом и заполнить ими кэш.
+
+        Returns:
+            Словарь ключ → значение.
+
+        """
+        with self._lock:
+            rows = dict(self._connection.execute(_SELECT_ALL_SQL).fetchall())
+            self._cache.update(rows)
+        return rows
 
     def set(self, key: str, value: str | int | bool) -> None:
         """Установить значение настройки.
@@ -69,15 +178,55 @@ class Database:
             value: Значение (будет преобразовано в строку).
 
         """
-        self._connection.execute(
-            """
-            INSERT INTO settings (key, value)
-            VALUES (?, ?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value
-            """,
-            (key, str(value)),
-        )
-        self._connection.commit()
+        db_value = to_db_value(value)
+        with self._lock:
+            self._connection.execute(_UPSERT_SQL, (key, db_value))
+            self._cache[key] = db_value
+
+    def set_many(self, values: Mapping[str, str | int | bool]) -> None:
+        """Установить несколько значений одной транзакцией.
+
+        Args:
+            values: Отображение ключ → значение (будет преобразовано в строку).
+
+        """
+        rows = [(key, to_db_value(value)) for key, value in values.items()]
+        with self._lock:
+            self._execute_in_transaction(_UPSERT_SQL, rows)
+            self._cache.update(rows)
+
+    def set_defaults(self, defaults: Mapping[str, str | int | bool]) -> None:
+        """Записать значения по умолчанию одной транзакцией.
+
+        Существующие ключи не перезаписываются.
+
+        Args:
+            defaults: Отображение ключ → значение (будет преобразовано в строку).
+
+        """
+        rows = [(key, to_db_value(value)) for key, value in defaults.items()]
+        with self._lock:
+            self._execute_in_transaction(_INSERT_DEFAULT_SQL, rows)
+            for key in defaults:
+                self._cache.pop(key, None)
+
+    def _execute_in_transaction(self, sql: str, rows: list[tuple[str, str]]) -> None:
+        """Выполнить запрос для всех строк в одной транзакции.
+
+        Вызывается под self._lock.
+
+        Args:
+            sql: Параметризованный SQL-запрос.
+            rows: Параметры для каждой строки.
+
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.executemany(sql, rows)
+        except sqlite3.Error:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
 
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Получить булево значение настройки.
@@ -90,10 +239,7 @@ class Database:
             Булево значение.
 
         """
-        value = self.get(key)
-        if value is None:
-            return default
-        return value.lower() == "true"
+        return to_bool(self.get(key), default)
 
     def get_int(self, key: str, default: int = 0) -> int:
         """Получить целочисленное значение настройки.
@@ -106,14 +252,7 @@ class Database:
             Целочисленное значение.
 
         """
-        value = self.get(key)
-        if value is None:
-            return default
-        try:
-            return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Не удалось преобразовать '{key}' в int: {e}")
-            return default
+        return to_int(self.get(key), default)
 
     def close(self) -> None:
         """Закрыть соединение с базой данных."""
@@ -1,10 +1,5 @@
-"""Services package for business logic."""
+"""Services package for business logic.
 
-from src.services import autostart, position, timer, wallpaper
-
-__all__ = [
-    "autostart",
-    "position",
-    "timer",
-    "wallpaper",
-]
+Submodules are imported explicitly (``from src.services import autostart``),
+so importing one service does not load Qt or requests for the others.
+"""
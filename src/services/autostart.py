@@ -1,6 +1,7 @@
 """Управление автозапуском приложения в Windows."""
 
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -17,11 +18,13 @@ _RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 _APP_NAME = "TakeBreak"
 
 
+@cache
 def get_exe_path() -> str | None:
     """Получить путь к исполняемому файлу.
 
     Returns:
         Путь к .exe файлу, или None если запущено как Python-скрипт.
+        Результат не меняется за время жизни процесса и кэшируется.
 
     """
     if not getattr(sys, "frozen", False):
@@ -29,6 +32,28 @@ def get_exe_path() -> str | None:
     return str(Path(sys.executable).resolve())
 
 
+@cache
+def _read_autostart_state() -> bool:
+    """Прочитать состояние автозапуска из реестра.
+
+    Результат кэшируется до следующего переключения автозапуска.
+
+    Returns:
+        True если запись автозапуска есть, False иначе.
+
+    Raises:
+        OSError: Если реестр недоступен (ошибка не кэшируется).
+
+    """
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _RUN_KEY) as key:
+        try:
+            winreg.QueryValueEx(key, _APP_NAME)
+        except FileNotFoundError:
+            return False
+        else:
+            return True
+
+
 def is_autostart_enabled() -> bool:
     """Проверить, включён ли автозапуск в реестре Windows.
 
@@ -41,20 +66,11 @@ def is_autostart_enabled() -> bool:
         return False
 
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _RUN_KEY)
+        return _read_autostart_state()
     except OSError as e:
         logger.error(f"Не удалось открыть ключ реестра: {e}")
         return False
 
-    try:
-        winreg.QueryValueEx(key, _APP_NAME)
-    except FileNotFoundError:
-        return False
-    else:
-        return True
-    finally:
-        winreg.CloseKey(key)
-
 
 def enable_autostart() -> None:
     """Включить автозапуск через реестр Windows.
@@ -81,11 +97,10 @@ def enable_autostart() -> None:
         logger.error(f"Не удалось открыть ключ реестра: {e}")
         return
 
-    try:
+    with key:
         winreg.SetValueEx(key, _APP_NAME, 0, winreg.REG_SZ, exe_path)
-        logger.info("Автозапуск включён")
-    finally:
-        winreg.CloseKey(key)
+    _read_autostart_state.cache_clear()
+    logger.info("Автозапуск включён")
 
 
 def disable_autostart() -> None:
@@ -108,10 +123,10 @@ def disable_autostart() -> None:
         logger.error(f"Не удалось открыть ключ реестра: {e}")
         return
 
-    try:
-        winreg.DeleteValue(key, _APP_NAME)
-        logger.info("Автозапуск отключён")
-    except FileNotFoundError:
-        logger.debug("Запись автозапуска не найдена, нечего удалять")
-    finally:
-        winreg.CloseKey(key)
+    with key:
+        try:
+            winreg.DeleteValue(key, _APP_NAME)
+            logger.info("Автозапуск отключён")
+        except FileNotFoundError:
+            logger.debug("Запись автозапуска не найдена, нечего удалять")
+    _read_autostart_state.cache_clear()
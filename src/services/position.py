@@ -17,6 +17,20 @@ class WidgetPosition(StrEnum):
 
 
 _POSITIONS = tuple(WidgetPosition)
+_NEXT_POSITION = {
+    position: _POSITIONS[(index + 1) % len(_POSITIONS)] for index, position in enumerate(_POSITIONS)
+}
+
+# Привязка по осям в половинах свободного места: 0 — левый/верхний край,
+# 1 — центр, 2 — правый/нижний край
+_ANCHORS: dict[WidgetPosition, tuple[int, int]] = {
+    WidgetPosition.TOP_LEFT: (0, 0),
+    WidgetPosition.TOP_CENTER: (1, 0),
+    WidgetPosition.TOP_RIGHT: (2, 0),
+    WidgetPosition.BOTTOM_LEFT: (0, 2),
+    WidgetPosition.BOTTOM_RIGHT: (2, 2),
+    WidgetPosition.BOTTOM_CENTER: (1, 2),
+}
 
 
 def calculate_position(
@@ -39,17 +53,9 @@ def calculate_position(
         Вычисленная позиция QPoint.
 
     """
-    pos_name = position.lower()
-
-    y = 0 if "top" in pos_name else screen_height - widget_height
-
-    if "left" in pos_name:
-        x = 0
-    elif "right" in pos_name:
-        x = screen_width - widget_width
-    else:
-        x = (screen_width - widget_width) // 2
-
+    anchor_x, anchor_y = _ANCHORS[position]
+    x = (screen_width - widget_width) * anchor_x // 2
+    y = (screen_height - widget_height) * anchor_y // 2
     return QPoint(x, y)
 
 
@@ -63,6 +69,4 @@ def get_next_position(current: WidgetPosition) -> WidgetPosition:
         Следующая позиция в цикле.
 
     """
-    current_index = _POSITIONS.index(current)
-    next_index = (current_index + 1) % len(_POSITIONS)
-    return _POSITIONS[next_index]
+    return _NEXT_POSITION[current]
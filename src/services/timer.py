@@ -1,21 +1,43 @@
 """Управление состоянием таймера работы и перерыва."""
 
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import timedelta
 
 from loguru import logger
 
 from src.constants.settings import BREAK_DURATION_MIN, DEFAULT_WORK_DURATION_MIN
 
+_NS_IN_MINUTE = 60 * 1_000_000_000
+_NS_IN_MICROSECOND = 1_000
+
+
+def _remaining(end_time: int) -> timedelta:
+    """Посчитать оставшееся время до монотонного дедлайна.
+
+    Args:
+        end_time: Дедлайн в наносекундах time.monotonic_ns().
+
+    Returns:
+        Оставшееся время, не меньше нуля.
+
+    """
+    remaining_ns = max(end_time - time.monotonic_ns(), 0)
+    return timedelta(microseconds=remaining_ns // _NS_IN_MICROSECOND)
+
 
 class TimerManager:
-    """Управляет состоянием таймеров работы и перерыва."""
+    """Управляет состоянием таймеров работы и перерыва.
+
+    Дедлайны хранятся в наносекундах монотонных часов, поэтому
+    перевод системного времени не сбивает таймеры.
+    """
 
     def __init__(self) -> None:
         """Инициализировать менеджер таймера."""
         self.work_duration: int = DEFAULT_WORK_DURATION_MIN
         self.break_duration: int = BREAK_DURATION_MIN
-        self.work_end_time: datetime | None = None
-        self.break_end_time: datetime | None = None
+        self.work_end_time: int | None = None
+        self.break_end_time: int | None = None
 
     def start_work(self, duration: int | None = None) -> None:
         """Запустить рабочий таймер.
@@ -27,12 +49,12 @@ class TimerManager:
         if duration is not None:
             self.work_duration = duration
 
-        self.work_end_time = datetime.now(UTC) + timedelta(minutes=self.work_duration)
+        self.work_end_time = time.monotonic_ns() + self.work_duration * _NS_IN_MINUTE
         logger.debug(f"Рабочий таймер запущен на {self.work_duration} минут")
 
     def start_break(self) -> None:
         """Запустить таймер перерыва."""
-        self.break_end_time = datetime.now(UTC) + timedelta(minutes=self.break_duration)
+        self.break_end_time = time.monotonic_ns() + self.break_duration * _NS_IN_MINUTE
         self.work_end_time = None
         logger.debug(f"Таймер перерыва запущен на {self.break_duration} минут")
 
@@ -45,23 +67,23 @@ class TimerManager:
         """Получить оставшееся рабочее время.
 
         Returns:
-            Оставшееся время как timedelta, или None если таймер не активен.
+            Оставшееся время (не меньше нуля), или None если таймер не активен.
 
         """
         if self.work_end_time is None:
             return None
-        return self.work_end_time - datetime.now(UTC)
+        return _remaining(self.work_end_time)
 
     def get_break_remaining(self) -> timedelta | None:
         """Получить оставшееся время перерыва.
 
         Returns:
-            Оставшееся время как timedelta, или None если перерыв не активен.
+            Оставшееся время (не меньше нуля), или None если перерыв не активен.
 
         """
         if self.break_end_time is None:
             return None
-        return self.break_end_time - datetime.now(UTC)
+        return _remaining(self.break_end_time)
 
     def is_work_active(self) -> bool:
         """Проверить, активен ли рабочий таймер.
@@ -90,7 +112,7 @@ class TimerManager:
         """
         if self.work_end_time is None:
             return False
-        return datetime.now(UTC) >= self.work_end_time
+        return time.monotonic_ns() >= self.work_end_time
 
     def is_break_expired(self) -> bool:
         """Проверить, истёк ли таймер перерыва.
@@ -101,4 +123,4 @@ class TimerManager:
         """
         if self.break_end_time is None:
             return False
-        return datetime.now(UTC) >= self.break_end_time
+        return time.monotonic_ns() >= self.break_end_time
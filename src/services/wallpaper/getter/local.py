@@ -1,5 +1,6 @@
 """Локальный getter обоев."""
 
+import os
 from pathlib import Path
 from random import choice
 
@@ -9,6 +10,8 @@ from src.constants.path import Directories
 
 from .base import BaseWallpaperGetter
 
+_WALLPAPER_SUFFIXES = (".jpg", ".png")
+
 
 class LocalWallpaperGetter(BaseWallpaperGetter):
     """Получение случайных обоев из локальной папки."""
@@ -21,6 +24,8 @@ class LocalWallpaperGetter(BaseWallpaperGetter):
 
         """
         self.wallpaper_dir = folder_path or Directories.WALLPAPERS_DIR
+        self._cached_wallpapers: list[str] = []
+        self._cached_mtime_ns: int | None = None
 
     def get_wallpaper(self) -> Path | None:
         """Получить случайные обои из локальной папки.
@@ -29,14 +34,35 @@ class LocalWallpaperGetter(BaseWallpaperGetter):
             Путь к изображению или None если не найдено.
 
         """
-        if not self.wallpaper_dir.exists():
+        try:
+            mtime_ns = self.wallpaper_dir.stat().st_mtime_ns
+        except OSError:
             logger.warning(f"Папка обоев {self.wallpaper_dir} не существует")
             return None
 
-        wallpapers = list(self.wallpaper_dir.glob("*.jpg")) + list(self.wallpaper_dir.glob("*.png"))
+        # Список пересобирается только когда содержимое папки изменилось
+        if mtime_ns != self._cached_mtime_ns:
+            self._cached_wallpapers = self._scan_wallpapers()
+            self._cached_mtime_ns = mtime_ns
 
-        if not wallpapers:
+        if not self._cached_wallpapers:
             logger.warning("В папке не найдено обоев")
             return None
 
-        return choice(wallpapers)
+        return Path(choice(self._cached_wallpapers))
+
+    def _scan_wallpapers(self) -> list[str]:
+        """Найти изображения в папке обоев одним проходом.
+
+        Path создаётся только для выбранного файла, а не для каждого в папке.
+
+        Returns:
+            Список путей к изображениям.
+
+        """
+        with os.scandir(self.wallpaper_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith(_WALLPAPER_SUFFIXES) and entry.is_file()
+            ]
@@ -1,9 +1,11 @@
 """Получение обоев с Picsum."""
 
+import time
 from pathlib import Path
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from src.constants.path import Files
 from src.constants.settings import LOAD_IMAGE_TIMEOUT_DEFAULT
@@ -11,6 +13,11 @@ from src.constants.url import PICSUM_URL
 
 from .base import BaseWallpaperGetter
 
+_POOL_CONNECTIONS = 2
+_POOL_MAXSIZE = 4
+_CHUNK_SIZE = 64 * 1024
+_CACHE_FRESH_SEC = 600
+
 
 class PicsumWallpaperGetter(BaseWallpaperGetter):
     """Получение случайных обоев с picsum.photos."""
@@ -27,7 +34,14 @@ class PicsumWallpaperGetter(BaseWallpaperGetter):
         self.timeout = LOAD_IMAGE_TIMEOUT_DEFAULT
         self.width = width
         self.height = height
+        self.url = PICSUM_URL.format(width=width, height=height)
         self.cache_path = cache_file_path or Files.WALLPAPER_CACHE_PATH
+        # Одна сессия на getter: keep-alive без нового TLS-рукопожатия на каждую загрузку
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE),
+        )
 
     def get_wallpaper(self) -> Path | None:
         """Получить случайные обои с Picsum.
@@ -36,16 +50,39 @@ class PicsumWallpaperGetter(BaseWallpaperGetter):
             Путь к скачанному изображению или None при ошибке.
 
         """
-        url = PICSUM_URL.format(width=self.width, height=self.height)
+        if self._is_cache_fresh():
+            logger.debug("Кэш онлайн-обоев свежий, загрузка пропущена")
+            return self.cache_path
+
+        # Загрузка идёт во временный файл: кэш никогда не бывает прочитан недописанным
+        tmp_path = self.cache_path.with_suffix(".tmp")
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            # Тело пишется в файл кусками, не собираясь целиком в памяти
+            with self._session.get(self.url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
 
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_bytes(response.content)
-        except requests.RequestException as e:
-            logger.warning(f"Не удалось загрузить обои с {url}: {e}")
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with tmp_path.open("wb") as file:
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        file.write(chunk)
+            tmp_path.replace(self.cache_path)
+        except (requests.RequestException, OSError) as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Не удалось загрузить обои с {self.url}: {e}")
             return None
         else:
-            logger.debug(f"Онлайн-обои с {url} сохранены")
+            logger.debug(f"Онлайн-обои с {self.url} сохранены")
             return self.cache_path
+
+    def _is_cache_fresh(self) -> bool:
+        """Проверить, скачан ли кэш недавно.
+
+        Returns:
+            True если файл кэша моложе _CACHE_FRESH_SEC секунд.
+
+        """
+        try:
+            mtime = self.cache_path.stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - mtime < _CACHE_FRESH_SEC
@@ -1,16 +1,24 @@
 """Управление обоями для overlay."""
 
 import threading
+import time
 from pathlib import Path
 
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 
 from .getter.local import LocalWallpaperGetter
 from .getter.picsum import PicsumWallpaperGetter
 
+_IMAGE_CACHE_SIZE = 2
+_FETCH_COOLDOWN_S = 60.0
+
 
 class WallpaperManager:
-    """Управляет загрузкой и выбором обоев."""
+    """Управляет загрузкой и выбором обоев.
+
+    Изображения декодируются в QImage в фоновом потоке, а в QPixmap
+    преобразуются только в GUI-потоке при вызове get_wallpaper.
+    """
 
     def __init__(
         self,
@@ -34,7 +42,14 @@ class WallpaperManager:
         self._local_getter = LocalWallpaperGetter(local_folder_path)
         self._picsum_getter = PicsumWallpaperGetter(width, height, cache_file_path)
         self._lock = threading.Lock()
-        self._wallpaper: QPixmap | None = self._set_initial_wallpaper()
+        # Поток-демон не задерживает выход из приложения во время загрузки
+        self._fetch_thread: threading.Thread | None = None
+        self._fetch_inflight = False
+        self._last_fetch_ts: float | None = None
+        self._image_cache: dict[tuple[str, int], QImage] = {}
+        self._pixmap: QPixmap | None = None
+        self._pixmap_source: QImage | None = None
+        self._wallpaper: QImage | None = self._set_initial_wallpaper()
         self._fetch_wallpaper()
 
     def get_wallpaper(self) -> QPixmap | None:
@@ -46,23 +61,64 @@ class WallpaperManager:
         """
         self._fetch_wallpaper()
         with self._lock:
-            return self._wallpaper
+            image = self._wallpaper
+        return self._to_pixmap(image)
+
+    def _to_pixmap(self, image: QImage | None) -> QPixmap | None:
+        """Преобразовать QImage в QPixmap, переиспользуя прошлый результат.
+
+        Вызывается только из GUI-потока: QPixmap нельзя создавать в фоновых потоках.
+
+        Args:
+            image: Декодированное изображение.
+
+        Returns:
+            QPixmap или None если изображения нет.
+
+        """
+        if image is None:
+            return None
+        if image is not self._pixmap_source:
+            self._pixmap = QPixmap.fromImage(image)
+            self._pixmap_source = image
+        return self._pixmap
 
     def _fetch_wallpaper(self) -> None:
-        """Загрузить обои в фоновом потоке."""
+        """Загрузить обои в фоновом потоке.
 
-        def _fetch() -> None:
+        Если предыдущая загрузка ещё не завершилась или последняя успешная
+        была недавно, новая не запускается.
+        """
+        with self._lock:
+            if self._fetch_inflight:
+                return
+            if (
+                self._last_fetch_ts is not None
+                and time.monotonic() - self._last_fetch_ts < _FETCH_COOLDOWN_S
+            ):
+                return
+            self._fetch_inflight = True
+
+        self._fetch_thread = threading.Thread(target=self._fetch, daemon=True)
+        self._fetch_thread.start()
+
+    def _fetch(self) -> None:
+        """Загрузить и декодировать обои (выполняется в фоновом потоке)."""
+        try:
             if self._use_online:
                 path = self._picsum_getter.get_wallpaper()
             else:
                 path = self._local_getter.get_wallpaper()
 
-            pixmap = QPixmap(str(path)) if path else None
+            image = self._decode(path) if path else None
 
             with self._lock:
-                self._wallpaper = pixmap
-
-        threading.Thread(daemon=True, target=_fetch).start()
+                self._wallpaper = image
+                if image is not None:
+                    self._last_fetch_ts = time.monotonic()
+        finally:
+            with self._lock:
+                self._fetch_inflight = False
 
     def set_use_online(self, use_online: bool) -> None:
         """Установить режим загрузки обоев.
@@ -72,21 +128,54 @@ class WallpaperManager:
 
         """
         self._use_online = use_online
+        # Смена источника должна сразу загрузить обои из нового источника
+        with self._lock:
+            self._last_fetch_ts = None
 
-    def _set_initial_wallpaper(self) -> QPixmap | None:
+    def _set_initial_wallpaper(self) -> QImage | None:
         """Установить начальные обои из кэша или локальных файлов."""
-        wallpaper: QPixmap | None = None
+        wallpaper: QImage | None = None
 
         if self._use_online and self._picsum_getter.cache_path.exists():
-            wallpaper = QPixmap(str(self._picsum_getter.cache_path))
-            if wallpaper.isNull():
-                wallpaper = None
+            wallpaper = self._decode(self._picsum_getter.cache_path)
 
         if not wallpaper:
             local_path = self._local_getter.get_wallpaper()
             if local_path:
-                wallpaper = QPixmap(str(local_path))
-                if wallpaper.isNull():
-                    wallpaper = None
+                wallpaper = self._decode(local_path)
 
         return wallpaper
+
+    def _decode(self, path: Path) -> QImage | None:
+        """Декодировать изображение с кэшем по пути и времени изменения.
+
+        Пока файл не изменился, повторный вызов не декодирует его заново.
+
+        Args:
+            path: Путь к изображению.
+
+        Returns:
+            QImage или None если файл недоступен или не декодируется.
+
+        """
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._image_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # QImage, в отличие от QPixmap, можно безопасно создавать вне GUI-потока
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+
+        with self._lock:
+            if len(self._image_cache) >= _IMAGE_CACHE_SIZE:
+                # Вытесняется самая старая запись (словарь хранит порядок вставки)
+                del self._image_cache[next(iter(self._image_cache))]
+            self._image_cache[key] = image
+        return image
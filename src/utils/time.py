@@ -2,6 +2,30 @@
 
 from datetime import timedelta
 
+_MAX_TABLE_SECONDS = 3600
+
+# All MM:SS strings up to an hour, so the per-second tick is a tuple lookup
+_TIME_STRINGS = tuple(
+    f"{minutes:02d}:{seconds:02d}"
+    for minutes, seconds in (divmod(total, 60) for total in range(_MAX_TABLE_SECONDS + 1))
+)
+
+
+def format_seconds(total: int) -> str:
+    """Format whole seconds to MM:SS string format.
+
+    Args:
+        total: Number of whole seconds.
+
+    Returns:
+        Formatted time string as MM:SS.
+
+    """
+    if 0 <= total <= _MAX_TABLE_SECONDS:
+        return _TIME_STRINGS[total]
+    minutes, seconds = divmod(total, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
 
 def format_time(remaining: timedelta) -> str:
     """Format timedelta to MM:SS string format.
@@ -13,6 +37,4 @@ def format_time(remaining: timedelta) -> str:
         Formatted time string as MM:SS.
 
     """
-    minutes = int(remaining.total_seconds() // 60)
-    seconds = int(remaining.total_seconds() % 60)
-    return f"{minutes:02d}:{seconds:02d}"
+    return format_seconds(int(remaining.total_seconds()))
@@ -1,13 +1,45 @@
 """Background rendering utilities."""
 
-from PySide6.QtCore import QPoint, QRect, Qt
+from PySide6.QtCore import QPoint, QRect, QSize, Qt
 from PySide6.QtGui import QColor, QPainter, QPixmap
 
+_WALLPAPER_TINT = QColor(0, 0, 0, 10)
+_FALLBACK_COLOR = QColor(0, 0, 0, 220)
+
+
+def prepare_wallpaper(wallpaper: QPixmap, size: QSize, *, smooth: bool = True) -> QPixmap:
+    """Scale wallpaper to cover the given size and bake in the dark tint.
+
+    Args:
+        wallpaper: The wallpaper to prepare.
+        size: The size to cover.
+        smooth: Use smooth (bilinear) scaling; fast scaling is much cheaper
+            but lower quality.
+
+    Returns:
+        The scaled and tinted wallpaper, ready to be drawn as is.
+
+    """
+    mode = (
+        Qt.TransformationMode.SmoothTransformation
+        if smooth
+        else Qt.TransformationMode.FastTransformation
+    )
+    prepared = wallpaper.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, mode)
+    # Add a dark overlay for text readability once, not on every paint
+    painter = QPainter(prepared)
+    painter.fillRect(prepared.rect(), _WALLPAPER_TINT)
+    painter.end()
+    return prepared
+
 
 def paint_background(
     painter: QPainter,
     rect: QRect,
     wallpaper: QPixmap | None,
+    *,
+    prepared: bool = False,
+    exposed: QRect | None = None,
 ) -> None:
     """Paint background with wallpaper or solid color.
 
@@ -15,23 +47,22 @@ def paint_background(
         painter: The QPainter instance.
         rect: The rectangle to paint.
         wallpaper: The wallpaper to use, or None for solid background.
+        prepared: Whether the wallpaper already comes from prepare_wallpaper
+            for this rect, so it is drawn with a single blit.
+        exposed: The part of rect that needs repainting; defaults to all of it.
 
     """
+    target = rect if exposed is None else exposed
     if wallpaper and not wallpaper.isNull():
-        # Scale wallpaper to fit the screen while maintaining aspect ratio
-        scaled_wallpaper = wallpaper.scaled(
-            rect.size(),
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        if not prepared:
+            wallpaper = prepare_wallpaper(wallpaper, rect.size())
         # Center the image
         point = QPoint(
-            (rect.width() - scaled_wallpaper.width()) // 2,
-            (rect.height() - scaled_wallpaper.height()) // 2,
+            (rect.width() - wallpaper.width()) // 2,
+            (rect.height() - wallpaper.height()) // 2,
         )
-        painter.drawPixmap(point, scaled_wallpaper)
-        # Add a dark overlay for text readability
-        painter.fillRect(rect, QColor(0, 0, 0, 10))
+        # Blit only the exposed part of the image
+        painter.drawPixmap(target, wallpaper, target.translated(-point))
     else:
         # Fallback to a simple dark background
-        painter.fillRect(rect, QColor(0, 0, 0, 220))
+        painter.fillRect(target, _FALLBACK_COLOR)
@@ -3,14 +3,14 @@
 from datetime import UTC, datetime, timedelta
 
 from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QCloseEvent, QKeyEvent, QPainter, QPaintEvent, QShowEvent
+from PySide6.QtGui import QCloseEvent, QKeyEvent, QPainter, QPaintEvent, QPixmap, QShowEvent
 from PySide6.QtWidgets import QLabel, QLineEdit, QVBoxLayout, QWidget
 
 from src.config import texts
 from src.constants.settings import MAX_FOCUS_LENGTH
 from src.services.wallpaper import WallpaperManager
 from src.utils.time import format_time
-from src.widgets.background import paint_background
+from src.widgets.background import paint_background, prepare_wallpaper
 from src.widgets.styles import EXTRA_REST_LABEL_STYLE, OVERLAY_INPUT_STYLE, OVERLAY_LABEL_STYLE
 
 
@@ -33,8 +33,8 @@ class BlockingOverlay(QWidget):
     def __init__(self, screen_width: int, screen_height: int) -> None:
         """Initialize the overlay window.
 
-        Sets up the window's appearance, wallpaper manager, UI elements,
-        and internal state.
+        Sets up the window's appearance, UI elements, and internal state.
+        The wallpaper manager is created on the first show.
 
         Args:
             screen_width: The width of the screen.
@@ -44,12 +44,16 @@ class BlockingOverlay(QWidget):
         super().__init__()
         self._screen_width = screen_width
         self._screen_height = screen_height
-        self._setup_wallpaper_manager()
+        self.wallpaper_manager: WallpaperManager | None = None
+        self._use_online_wallpapers = True
         self._setup_window_config()
         self._create_ui_elements()
         self._setup_layout()
         self.is_blocking = False
         self.extra_rest_start: datetime | None = None
+        self._current_wallpaper: QPixmap | None = None
+        self._scaled_wallpaper: QPixmap | None = None
+        self._scaled_key: tuple[int, int, int] | None = None
 
     def _setup_window_config(self) -> None:
         """Configure the window's appearance and behavior.
@@ -65,12 +69,34 @@ class BlockingOverlay(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-    def _setup_wallpaper_manager(self) -> None:
-        """Initialize the wallpaper manager."""
-        self.wallpaper_manager = WallpaperManager(
-            width=self._screen_width,
-            height=self._screen_height,
-        )
+    def _get_wallpaper_manager(self) -> WallpaperManager:
+        """Return the wallpaper manager, creating it on first use.
+
+        Deferring creation keeps the initial decode and the first fetch off
+        the startup path and lets them use the saved online wallpapers setting.
+
+        Returns:
+            The wallpaper manager.
+
+        """
+        if self.wallpaper_manager is None:
+            self.wallpaper_manager = WallpaperManager(
+                width=self._screen_width,
+                height=self._screen_height,
+                use_online=self._use_online_wallpapers,
+            )
+        return self.wallpaper_manager
+
+    def set_use_online_wallpapers(self, enabled: bool) -> None:
+        """Set whether wallpapers are loaded from the internet.
+
+        Args:
+            enabled: True for online wallpapers, False for local ones.
+
+        """
+        self._use_online_wallpapers = enabled
+        if self.wallpaper_manager is not None:
+            self.wallpaper_manager.set_use_online(enabled)
 
     def _create_ui_elements(self) -> None:
         """Create all UI elements for the overlay."""
@@ -84,6 +110,7 @@ class BlockingOverlay(QWidget):
         self.label.setStyleSheet(OVERLAY_LABEL_STYLE)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label.setTextFormat(Qt.TextFormat.RichText)
+        self._label_text = ""
 
     def _create_focus_input(self) -> None:
         """Create the focus input field."""
@@ -94,9 +121,7 @@ class BlockingOverlay(QWidget):
         self.focus_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.focus_input.returnPressed.connect(self.enter_pressed.emit)
 
-        font_metrics = self.focus_input.fontMetrics()
-        char_width = font_metrics.horizontalAdvance("M")
-        text_width = char_width * (MAX_FOCUS_LENGTH + 2)
+        text_width = self.focus_input.fontMetrics().horizontalAdvance("M" * (MAX_FOCUS_LENGTH + 2))
         total_width = text_width + 24 + 4 + 40  # Padding + Border + Margin
         self.focus_input.setFixedWidth(total_width)
 
@@ -106,6 +131,7 @@ class BlockingOverlay(QWidget):
         self.extra_rest_label.setStyleSheet(EXTRA_REST_LABEL_STYLE)
         self.extra_rest_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.extra_rest_label.hide()
+        self._extra_rest_text = ""
         self.extra_rest_timer = QTimer()
         self.extra_rest_timer.timeout.connect(self._update_extra_rest_timer)
 
@@ -164,7 +190,13 @@ class BlockingOverlay(QWidget):
             event: The QShowEvent object.
 
         """
-        self._current_wallpaper = self.wallpaper_manager.get_wallpaper()
+        self._current_wallpaper = self._get_wallpaper_manager().get_wallpaper()
+        # An opaque wallpaper covers every pixel, so Qt can skip erasing the background
+        wallpaper = self._current_wallpaper
+        self.setAttribute(
+            Qt.WidgetAttribute.WA_OpaquePaintEvent,
+            wallpaper is not None and not wallpaper.isNull() and not wallpaper.hasAlphaChannel(),
+        )
         super().showEvent(event)
         self.update()  # Trigger a repaint with the new wallpaper
 
@@ -178,9 +210,55 @@ class BlockingOverlay(QWidget):
 
         """
         painter = QPainter(self)
-        paint_background(painter, self.rect(), self._current_wallpaper)
+        wallpaper = self._get_scaled_wallpaper()
+        paint_background(
+            painter,
+            self.rect(),
+            wallpaper,
+            prepared=wallpaper is not None,
+            exposed=event.rect(),
+        )
         super().paintEvent(event)
 
+    def _get_scaled_wallpaper(self) -> QPixmap | None:
+        """Return the current wallpaper scaled and tinted for the window size.
+
+        The prepared pixmap is keyed by the wallpaper's cacheKey and the window
+        size, so it survives across breaks while the wallpaper is unchanged
+        and repaints are a plain blit. A new pixmap is first scaled fast so the
+        overlay appears at once, and a smooth version replaces it on the next
+        event loop iteration.
+
+        Returns:
+            The scaled wallpaper, or the current one if it cannot be scaled.
+
+        """
+        wallpaper = self._current_wallpaper
+        if wallpaper is None or wallpaper.isNull():
+            return wallpaper
+
+        size = self.size()
+        key = (wallpaper.cacheKey(), size.width(), size.height())
+        if self._scaled_wallpaper is None or self._scaled_key != key:
+            self._scaled_wallpaper = prepare_wallpaper(wallpaper, size, smooth=False)
+            self._scaled_key = key
+            QTimer.singleShot(0, self, self._upgrade_wallpaper_quality)
+        return self._scaled_wallpaper
+
+    def _upgrade_wallpaper_quality(self) -> None:
+        """Replace the fast-scaled wallpaper with a smoothly scaled one and repaint."""
+        wallpaper = self._current_wallpaper
+        if wallpaper is None or wallpaper.isNull():
+            return
+
+        size = self.size()
+        if self._scaled_key != (wallpaper.cacheKey(), size.width(), size.height()):
+            # Wallpaper or size changed meanwhile; the next paint schedules its own upgrade
+            return
+
+        self._scaled_wallpaper = prepare_wallpaper(wallpaper, size)
+        self.update()
+
     def set_text(self, text: str) -> None:
         """Set the text for the main overlay label.
 
@@ -188,6 +266,10 @@ class BlockingOverlay(QWidget):
             text: The text to be displayed.
 
         """
+        # Unchanged text would still trigger a relayout and repaint
+        if text == self._label_text:
+            return
+        self._label_text = text
         self.label.setText(text)
 
     def get_focus_text(self) -> str:
@@ -230,6 +312,7 @@ class BlockingOverlay(QWidget):
         self.extra_rest_label.hide()
         self.extra_rest_timer.stop()
         self.extra_rest_start = None
+        self._extra_rest_text = ""
 
     def show_extra_rest_timer(self, start_time: datetime) -> None:
         """Show and starts the extra rest timer.
@@ -257,10 +340,14 @@ class BlockingOverlay(QWidget):
         seconds = total_seconds % 60
 
         if hours > 0:
-            text = f"☕ Дополнительный отдых: +{hours:d}ч {minutes:02d}:{seconds:02d}"
+            text = f"{texts.Overlay.EXTRA_REST_PREFIX}{hours:d}ч {minutes:02d}:{seconds:02d}"
         else:
-            text = f"☕ Дополнительный отдых: +{minutes:02d}:{seconds:02d}"
-        self.extra_rest_label.setText(text)
+            text = f"{texts.Overlay.EXTRA_REST_PREFIX}{minutes:02d}:{seconds:02d}"
+
+        # Skip the relayout when the tick landed within the same displayed second
+        if text != self._extra_rest_text:
+            self._extra_rest_text = text
+            self.extra_rest_label.setText(text)
 
     def show(self) -> None:
         """Показать overlay в полноэкранном режиме.
@@ -48,6 +48,7 @@ TIMER_WIDGET_STYLE = """
     }
 """
 
+# The red state is switched via the "state" dynamic property, without re-parsing
 TIMER_TIME_STYLE = """
     QLabel {
         font-size: 18px;
@@ -56,14 +57,7 @@ TIMER_TIME_STYLE = """
         padding: 8px 12px;
         background: transparent;
     }
-"""
-
-TIMER_TIME_RED_STYLE = """
-    QLabel {
-        font-size: 18px;
-        color: white;
-        font-weight: bold;
-        padding: 8px 12px;
+    QLabel[state="red"] {
         background-color: rgba(200, 50, 50, 150);
     }
 """
@@ -106,6 +100,16 @@ WELCOME_DESCRIPTION_STYLE = """
     }
 """
 
+WELCOME_MODE_LABEL_STYLE = """
+    font-size: 14px;
+    color: #2c3e50;
+    font-weight: bold;
+"""
+
+WELCOME_MODE_RADIO_STYLE = """
+    font-size: 13px;
+"""
+
 WELCOME_BUTTONS_STYLE = """
     QPushButton {
         font-size: 14px;
@@ -2,19 +2,29 @@
 
 from datetime import timedelta
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPainter, QPaintEvent
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPaintEvent
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from src.constants.settings import RED_SECOND_THRESHOLD
-from src.utils.time import format_time
+from src.utils.time import format_seconds
 from src.widgets.styles import (
     TIMER_FOCUS_STYLE,
-    TIMER_TIME_RED_STYLE,
     TIMER_TIME_STYLE,
     TIMER_WIDGET_STYLE,
 )
 
+_WINDOW_FLAGS = (
+    Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool
+)
+_BACKGROUND_COLOR = QColor(0, 0, 0, 150)  # Semi-transparent black
+_BORDER_COLOR = QColor(255, 255, 255, 20)
+_TRANSPARENT_BRUSH = QBrush(Qt.GlobalColor.transparent)
+_CORNER_RADIUS = 10
+_STATE_PROPERTY = "state"
+_STATE_RED = "red"
+_STATE_NORMAL = "normal"
+
 
 class TimerWidget(QWidget):
     """Widget for displaying the timer."""
@@ -25,11 +35,7 @@ class TimerWidget(QWidget):
         Sets up window flags and appearance, and creates UI elements.
         """
         super().__init__()
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint
-            | Qt.WindowType.WindowStaysOnTopHint
-            | Qt.WindowType.Tool,
-        )
+        self.setWindowFlags(_WINDOW_FLAGS)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
         # Apply widget background style
@@ -44,6 +50,12 @@ class TimerWidget(QWidget):
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.focus_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+        self._is_red = False
+        self._time_text = ""
+        self._focus_text = ""
+        # Stylesheets are parsed once; state changes only re-polish the label
+        self.time_label.setStyleSheet(TIMER_TIME_STYLE)
+        self.focus_label.setStyleSheet(TIMER_FOCUS_STYLE)
         self.reset_style()
 
         # Add padding inside widget
@@ -63,25 +75,36 @@ class TimerWidget(QWidget):
         self.setMinimumHeight(min_height)
         self.setMinimumWidth(180)
 
+        self._rounded_path = QPainterPath()
+        self._rounded_path_size = QSize()
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the widget background with transparency."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        path = self._get_rounded_path()
+
         # Draw semi-transparent rounded rectangle background
-        rect = self.rect()
-        bg_color = QColor(0, 0, 0, 150)  # Semi-transparent black
-        painter.setBrush(bg_color)
-        painter.drawRoundedRect(rect, 10, 10)
+        painter.setBrush(_BACKGROUND_COLOR)
+        painter.drawPath(path)
 
         # Draw white border
-        border_color = QColor(255, 255, 255, 20)
-        painter.setPen(border_color)
-        painter.setBrush(Qt.GlobalColor.transparent)
-        painter.drawRoundedRect(rect, 10, 10)
+        painter.setPen(_BORDER_COLOR)
+        painter.setBrush(_TRANSPARENT_BRUSH)
+        painter.drawPath(path)
 
         super().paintEvent(event)
 
+    def _get_rounded_path(self) -> QPainterPath:
+        """Return the rounded background shape, rebuilt only when the size changes."""
+        size = self.size()
+        if size != self._rounded_path_size:
+            self._rounded_path = QPainterPath()
+            self._rounded_path.addRoundedRect(QRectF(self.rect()), _CORNER_RADIUS, _CORNER_RADIUS)
+            self._rounded_path_size = size
+        return self._rounded_path
+
     def set_focus_text(self, text: str) -> None:
         """Set the focus text.
 
@@ -89,6 +112,11 @@ class TimerWidget(QWidget):
             text: The focus text to be displayed.
 
         """
+        # Skip the relayout below when the focus did not change
+        if text == self._focus_text:
+            return
+        self._focus_text = text
+
         if text:
             self.focus_label.setText(f"🎯 {text}")
             self.focus_label.setVisible(True)
@@ -101,28 +129,41 @@ class TimerWidget(QWidget):
 
     def reset_style(self) -> None:
         """Reset the widget's style to its initial state."""
-        self.time_label.setStyleSheet(TIMER_TIME_STYLE)
-        self.focus_label.setStyleSheet(TIMER_FOCUS_STYLE)
+        self._set_red(red=False)
         # Don't hide focus_label here - it should stay visible if set
 
     def update_time(self, remaining: timedelta) -> None:
         """Update the displayed time.
 
-        If less than a minute remains, the style changes to red.
+        If less than a minute remains, the style changes to red. The style
+        and the text are only touched when they change.
 
         Args:
             remaining: The remaining time.
 
         """
+        total = int(remaining.total_seconds())
+
         # Color in red if less than a minute remains
-        if remaining.total_seconds() <= RED_SECOND_THRESHOLD:
-            self._paint_it_red()
-        else:
-            # Update only time style, keep focus visible
-            self.time_label.setStyleSheet(TIMER_TIME_STYLE)
+        should_be_red = total <= RED_SECOND_THRESHOLD
+        if should_be_red != self._is_red:
+            self._set_red(red=should_be_red)
 
-        self.time_label.setText(format_time(remaining))
+        text = format_seconds(total)
+        if text != self._time_text:
+            self._time_text = text
+            self.time_label.setText(text)
 
-    def _paint_it_red(self) -> None:
-        """Paint the timer in red."""
-        self.time_label.setStyleSheet(TIMER_TIME_RED_STYLE)
+    def _set_red(self, *, red: bool) -> None:
+        """Switch the time label between the red and normal styles.
+
+        Args:
+            red: Whether to paint the timer in red.
+
+        """
+        self._is_red = red
+        self.time_label.setProperty(_STATE_PROPERTY, _STATE_RED if red else _STATE_NORMAL)
+        # Re-polish applies the property selector from the already parsed stylesheet
+        style = self.time_label.style()
+        style.unpolish(self.time_label)
+        style.polish(self.time_label)
@@ -19,6 +19,8 @@ from src.widgets.styles import (
     WELCOME_BUTTONS_STYLE,
     WELCOME_DESCRIPTION_STYLE,
     WELCOME_DIALOG_STYLE,
+    WELCOME_MODE_LABEL_STYLE,
+    WELCOME_MODE_RADIO_STYLE,
     WELCOME_SUBTITLE_STYLE,
     WELCOME_TITLE_STYLE,
 )
@@ -105,7 +107,7 @@ class WelcomeDialog(QDialog):
 
         # Label
         label = QLabel("Выберите режим работы:")
-        label.setStyleSheet("font-size: 14px; color: #2c3e50; font-weight: bold;")
+        label.setStyleSheet(WELCOME_MODE_LABEL_STYLE)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label)
 
@@ -116,11 +118,11 @@ class WelcomeDialog(QDialog):
         self.work_mode_group = QButtonGroup()
 
         self.radio_25 = QRadioButton(f"🚀 {POMODORO_MODE_MIN} минут (Pomodoro)")
-        self.radio_25.setStyleSheet("font-size: 13px;")
+        self.radio_25.setStyleSheet(WELCOME_MODE_RADIO_STYLE)
         self.work_mode_group.addButton(self.radio_25, POMODORO_MODE_MIN)
 
         self.radio_45 = QRadioButton(f"⏳ {STANDARD_MODE_MIN} минут (Стандартный)")
-        self.radio_45.setStyleSheet("font-size: 13px;")
+        self.radio_45.setStyleSheet(WELCOME_MODE_RADIO_STYLE)
         self.radio_45.setChecked(True)  # Default
         self.work_mode_group.addButton(self.radio_45, STANDARD_MODE_MIN)
 
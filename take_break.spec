@@ -22,7 +22,6 @@ a = Analysis(
     hiddenimports=[
         'keyboard',
         'requests',
-        'PIL',
         'PySide6.QtCore',
         'PySide6.QtGui',
         'PySide6.QtWidgets',
@@ -31,6 +30,8 @@ a = Analysis(
     hooksconfig={},
     runtime_hooks=[],
     excludes=[
+        # Pillow нужен только тестам, иконка уже лежит готовым .ico
+        'PIL',
         # Исключить весь мусор PySide6
         'PySide6.QtCore.QtCoreTranslations',
         'PySide6.QtGui.translations',
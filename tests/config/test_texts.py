@@ -46,3 +46,11 @@ def test_get_initial_text_default_duration() -> None:
     result = texts.Overlay.get_initial_text(work_duration=None)
 
     assert f"{DEFAULT_WORK_DURATION_MIN}-минутный" in result
+
+
+def test_get_initial_text_is_cached() -> None:
+    """Test that repeated calls with the same arguments reuse the built HTML."""
+    first = texts.Overlay.get_initial_text("focus", POMODORO_MODE_MIN)
+    second = texts.Overlay.get_initial_text("focus", POMODORO_MODE_MIN)
+
+    assert first is second
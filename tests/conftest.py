@@ -1,13 +1,24 @@
 """Pytest configuration and fixtures."""
 
+import os
+from collections.abc import Iterator
+
 import pytest
+from loguru import logger
 from src.config.settings import Settings
 from src.constants.path import Files
 from src.db.db import Database
 
+# Render widgets offscreen unless a platform is set explicitly; qapp reads
+# this when it creates the QApplication
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Tests don't assert on log output: drop loguru's default stderr sink
+logger.remove()
+
 
 @pytest.fixture
-def test_settings() -> Settings:
-    """Get test settings instance."""
-    db = Database(db_path=Files.MEMORY_DB_PATH)
-    return Settings(db=db)
+def test_settings() -> Iterator[Settings]:
+    """Get test settings instance backed by a fresh in-memory DB."""
+    with Database(db_path=Files.MEMORY_DB_PATH) as db:
+        yield Settings(db=db)
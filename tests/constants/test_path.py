@@ -60,6 +60,22 @@ class TestDirectories:
         Directories().make_dirs()
         Directories().make_dirs()
 
+    def test_make_dirs_recreates_removed_directory(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Повторный make_dirs заново создаёт удалённую директорию."""
+        logs_dir = tmp_path / "logs"
+        for name in ("LOGS_DIR", "CACHE_DIR", "SETTINGS_DIR", "LOGO_DIR", "WALLPAPERS_DIR"):
+            monkeypatch.setattr(Directories, name, logs_dir)
+
+        Directories().make_dirs()
+        logs_dir.rmdir()
+        Directories().make_dirs()
+
+        assert logs_dir.is_dir()
+
     def test_memory_db_path_is_string(self) -> None:
         """MEMORY_DB_PATH — строка ':memory:'."""
         assert Files.MEMORY_DB_PATH == ":memory:"
@@ -1,6 +1,6 @@
 """Тесты сервиса автозапуска."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.services import autostart
 
@@ -10,6 +10,7 @@ class TestAutostart:
 
     def test_get_exe_path_returns_none_when_not_frozen(self) -> None:
         """get_exe_path возвращает None для Python-скрипта."""
+        autostart.get_exe_path.cache_clear()
         with patch("sys.frozen", False, create=True):
             assert autostart.get_exe_path() is None
 
@@ -30,5 +31,33 @@ class TestAutostart:
 
     def test_enable_autostart_noop_when_not_frozen(self) -> None:
         """enable_autostart no-op для Python-скрипта."""
+        autostart.get_exe_path.cache_clear()
         with patch("sys.frozen", False, create=True):
             autostart.enable_autostart()
+
+    def test_is_autostart_enabled_caches_registry_read(self) -> None:
+        """Повторная проверка не обращается к реестру до переключения."""
+        fake_winreg = MagicMock()
+        autostart._read_autostart_state.cache_clear()
+        with patch.object(autostart, "winreg", fake_winreg):
+            assert autostart.is_autostart_enabled() is True
+            assert autostart.is_autostart_enabled() is True
+            assert fake_winreg.QueryValueEx.call_count == 1
+
+            autostart.disable_autostart()
+            autostart.is_autostart_enabled()
+            assert fake_winreg.QueryValueEx.call_count == 2
+
+        autostart._read_autostart_state.cache_clear()
+
+    def test_is_autostart_enabled_opens_key_read_only(self) -> None:
+        """Проверка состояния открывает ключ Run только на чтение."""
+        fake_winreg = MagicMock()
+        autostart._read_autostart_state.cache_clear()
+        with patch.object(autostart, "winreg", fake_winreg):
+            autostart.is_autostart_enabled()
+
+        fake_winreg.OpenKey.assert_called_once_with(
+            fake_winreg.HKEY_CURRENT_USER, autostart._RUN_KEY
+        )
+        autostart._read_autostart_state.cache_clear()
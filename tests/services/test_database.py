@@ -39,10 +39,19 @@ class TestDatabase:
         db.set("number", 42)
         assert db.get("number") == "42"
 
-    def test_set_converts_bool_to_string(self, db: Database) -> None:
-        """set преобразует bool в строку."""
+    def test_set_stores_bool_as_digit(self, db: Database) -> None:
+        """set хранит bool как "1"/"0"."""
         db.set("flag", True)
-        assert db.get("flag") == "True"
+        db.set("other", False)
+        assert db.get("flag") == "1"
+        assert db.get("other") == "0"
+        assert db.get_bool("flag") is True
+        assert db.get_bool("other") is False
+
+    def test_get_bool_reads_legacy_capitalized_true(self, db: Database) -> None:
+        """get_bool понимает "True", записанное старыми версиями."""
+        db.set("flag", "True")
+        assert db.get_bool("flag") is True
 
     def test_get_bool_returns_true_for_true_string(self, db: Database) -> None:
         """get_bool возвращает True для строки 'true'."""
@@ -73,6 +82,38 @@ class TestDatabase:
         db.set("bad", "not_a_number")
         assert db.get_int("bad", default=0) == 0
 
+    def test_set_many_writes_all_values(self, db: Database) -> None:
+        """set_many записывает и перезаписывает несколько ключей."""
+        db.set("a", "old")
+        db.set_many({"a": "new", "b": 2})
+        assert db.get("a") == "new"
+        assert db.get("b") == "2"
+
+    def test_set_defaults_inserts_missing_keys(self, db: Database) -> None:
+        """set_defaults записывает отсутствующие ключи."""
+        db.set_defaults({"a": "1", "b": 2})
+        assert db.get("a") == "1"
+        assert db.get("b") == "2"
+
+    def test_set_defaults_keeps_existing_values(self, db: Database) -> None:
+        """set_defaults не перезаписывает существующие значения."""
+        db.set("key", "user_value")
+        db.set_defaults({"key": "default"})
+        assert db.get("key") == "user_value"
+
+    def test_get_serves_repeated_reads_from_cache(self, db: Database) -> None:
+        """Повторное чтение не обращается к базе."""
+        db.set("key", "value")
+        db.get("key")
+        db.close()
+        assert db.get("key") == "value"
+
+    def test_set_defaults_replaces_cached_missing_key(self, db: Database) -> None:
+        """set_defaults сбрасывает закэшированное отсутствие ключа."""
+        assert db.get("key") is None
+        db.set_defaults({"key": "default"})
+        assert db.get("key") == "default"
+
     def test_context_manager_closes_connection(self) -> None:
         """Context manager закрывает соединение."""
         with Database(db_path=Files.MEMORY_DB_PATH) as db:
@@ -107,3 +148,15 @@ class TestDatabaseFile:
 
         with Database(db_path=db_path) as db:
             assert db.get("key") == "value"
+
+    def test_sets_busy_timeout(self, tmp_path: Path) -> None:
+        """Соединение ждёт блокировку вместо немедленной ошибки."""
+        with Database(db_path=tmp_path / "settings.db") as db:
+            timeout = db._connection.execute("PRAGMA busy_timeout").fetchone()[0]
+            assert timeout == 5000
+
+    def test_uses_wal_journal_mode(self, tmp_path: Path) -> None:
+        """Файловая БД открывается в режиме WAL."""
+        with Database(db_path=tmp_path / "settings.db") as db:
+            mode = db._connection.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
@@ -43,6 +43,19 @@ def test_calculate_position_center() -> None:
     assert pos == QPoint(860, 0)
 
 
+def test_calculate_position_bottom_center() -> None:
+    """Test calculating bottom-center position with odd free space."""
+    pos = calculate_position(
+        WidgetPosition.BOTTOM_CENTER,
+        screen_width=1921,
+        screen_height=1080,
+        widget_width=200,
+        widget_height=100,
+    )
+
+    assert pos == QPoint(860, 980)
+
+
 def test_get_next_position_cycles() -> None:
     """Test that position cycles through all 6 positions."""
     positions = list(WidgetPosition)
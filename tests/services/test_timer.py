@@ -1,6 +1,7 @@
 """Тесты менеджера таймера."""
 
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import timedelta
 
 import pytest
 from src.services.timer import TimerManager
@@ -76,12 +77,13 @@ class TestTimerManager:
 
     def test_start_work_sets_correct_end_time(self, manager: TimerManager) -> None:
         """Запуск работы устанавливает корректное время окончания."""
-        before = datetime.now(UTC)
+        before = time.monotonic_ns()
         manager.start_work(25)
-        after = datetime.now(UTC)
+        after = time.monotonic_ns()
 
-        expected_min = before + timedelta(minutes=25)
-        expected_max = after + timedelta(minutes=25)
+        duration_ns = 25 * 60 * 1_000_000_000
+        expected_min = before + duration_ns
+        expected_max = after + duration_ns
 
         assert manager.work_end_time is not None
         assert expected_min <= manager.work_end_time <= expected_max
@@ -112,3 +114,11 @@ class TestTimerManager:
         manager.end_break()
         assert not manager.is_break_active()
         assert not manager.is_work_active()
+
+    def test_remaining_is_clamped_to_zero(self, manager: TimerManager) -> None:
+        """Оставшееся время не уходит в минус после дедлайна."""
+        manager.start_work(25)
+        manager.work_end_time = time.monotonic_ns() - 1_000_000_000
+
+        assert manager.get_work_remaining() == timedelta(0)
+        assert manager.is_work_expired()
@@ -1,19 +1,51 @@
 """Tests for wallpaper manager."""
 
+import io
+import os
+import time
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
 from PIL import Image
 from PySide6.QtWidgets import QApplication
 from src.constants.settings import PRELOAD_HEIGHT_DEFAULT, PRELOAD_WIDTH_DEFAULT
 from src.services.wallpaper import WallpaperManager
+from src.services.wallpaper.getter import local
+from src.services.wallpaper.getter.local import LocalWallpaperGetter
+from src.services.wallpaper.getter.picsum import PicsumWallpaperGetter
 
 
-def test_local_wallpapers_only(tmp_path: Path, qapp: QApplication) -> None:
+@pytest.fixture(scope="session")
+def jpeg_blobs() -> dict[str, bytes]:
+    """Encode one solid-color JPEG per color once per session."""
+    blobs = {}
+    for color in ("blue", "red", "green"):
+        buffer = io.BytesIO()
+        Image.new("RGB", (16, 16), color=color).save(buffer, "JPEG")
+        blobs[color] = buffer.getvalue()
+    return blobs
+
+
+def _join_fetch(manager: WallpaperManager) -> None:
+    """Wait for the background fetch started by the manager to finish."""
+    assert manager._fetch_thread is not None
+    manager._fetch_thread.join()
+
+
+def _make_stale(path: Path) -> None:
+    """Set file mtime far enough in the past for the cache to count as stale."""
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+
+
+def test_local_wallpapers_only(
+    tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]
+) -> None:
     """Test that local wallpapers work when online is disabled."""
     # Create real wallpaper image
-    img = Image.new("RGB", (1920, 1080), color="blue")
-    wallpaper = tmp_path / "test.jpg"
-    img.save(wallpaper)
+    (tmp_path / "test.jpg").write_bytes(jpeg_blobs["blue"])
 
     manager = WallpaperManager(
         width=PRELOAD_WIDTH_DEFAULT,
@@ -27,14 +59,13 @@ def test_local_wallpapers_only(tmp_path: Path, qapp: QApplication) -> None:
     assert not pixmap.isNull()
 
 
-def test_local_wallpapers_loading(tmp_path: Path, qapp: QApplication) -> None:
+def test_local_wallpapers_loading(
+    tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]
+) -> None:
     """Test loading multiple local wallpapers."""
     # Create multiple wallpapers
-    colors = ["blue", "red", "green"]
-    for i, color in enumerate(colors):
-        img = Image.new("RGB", (1920, 1080), color=color)
-        wallpaper = tmp_path / f"test{i}.jpg"
-        img.save(wallpaper)
+    for i, blob in enumerate(jpeg_blobs.values()):
+        (tmp_path / f"test{i}.jpg").write_bytes(blob)
 
     manager = WallpaperManager(
         width=PRELOAD_WIDTH_DEFAULT,
@@ -52,12 +83,10 @@ def test_local_wallpapers_loading(tmp_path: Path, qapp: QApplication) -> None:
         assert not pixmap.isNull()
 
 
-def test_set_use_online(tmp_path: Path, qapp: QApplication) -> None:
+def test_set_use_online(tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]) -> None:
     """Test changing online wallpaper setting."""
     # Create test wallpaper
-    img = Image.new("RGB", (1920, 1080), color="red")
-    wallpaper = tmp_path / "test.jpg"
-    img.save(wallpaper)
+    (tmp_path / "test.jpg").write_bytes(jpeg_blobs["red"])
 
     manager = WallpaperManager(
         width=PRELOAD_WIDTH_DEFAULT,
@@ -102,3 +131,190 @@ def test_cache_directory_creation(tmp_path: Path, qapp: QApplication) -> None:
 
     # Verify manager exists
     assert manager is not None
+
+
+def test_picsum_getter_reuses_session(tmp_path: Path) -> None:
+    """Test that consecutive Picsum downloads go through one session."""
+    getter = PicsumWallpaperGetter(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        cache_file_path=tmp_path / "cache.jpg",
+    )
+    response = MagicMock()
+    response.iter_content.return_value = [b"ima", b"ge"]
+    response.__enter__.return_value = response
+
+    with patch.object(getter._session, "get", return_value=response) as mock_get:
+        assert getter.get_wallpaper() == tmp_path / "cache.jpg"
+        _make_stale(tmp_path / "cache.jpg")
+        assert getter.get_wallpaper() == tmp_path / "cache.jpg"
+
+    assert mock_get.call_count == 2
+    assert (tmp_path / "cache.jpg").read_bytes() == b"image"
+
+
+def test_decode_reuses_cached_image(
+    tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]
+) -> None:
+    """Test that an unchanged file is decoded only once."""
+    paths = []
+    for i, blob in enumerate(jpeg_blobs.values()):
+        path = tmp_path / f"test{i}.jpg"
+        path.write_bytes(blob)
+        paths.append(path)
+
+    manager = WallpaperManager(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        local_folder_path=tmp_path / "empty",
+        use_online=False,
+    )
+    first = manager._decode(paths[0])
+    second = manager._decode(paths[0])
+
+    assert first is not None
+    assert second is first
+
+    manager._decode(paths[1])
+    manager._decode(paths[2])
+    assert len(manager._image_cache) == 2
+    assert manager._decode(paths[0]) is not first
+
+
+def test_get_wallpaper_reuses_converted_pixmap(
+    tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]
+) -> None:
+    """Test that the same decoded image is converted to QPixmap only once."""
+    (tmp_path / "test.jpg").write_bytes(jpeg_blobs["blue"])
+    manager = WallpaperManager(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        local_folder_path=tmp_path,
+        use_online=False,
+    )
+    image = manager._decode(tmp_path / "test.jpg")
+
+    first = manager._to_pixmap(image)
+    assert first is not None
+    assert not first.isNull()
+    assert manager._to_pixmap(image) is first
+    assert manager._to_pixmap(None) is None
+
+
+def test_fetch_skipped_while_previous_inflight(tmp_path: Path, qapp: QApplication) -> None:
+    """Test that get_wallpaper does not queue a fetch while one is running."""
+    manager = WallpaperManager(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        local_folder_path=tmp_path,
+        use_online=False,
+    )
+    _join_fetch(manager)
+
+    with patch("src.services.wallpaper.wallpaper.threading.Thread") as mock_thread:
+        manager._fetch_inflight = True
+        manager.get_wallpaper()
+        mock_thread.assert_not_called()
+
+        manager._fetch_inflight = False
+        manager.get_wallpaper()
+        mock_thread.assert_called_once()
+
+
+def test_fetch_skipped_during_cooldown(
+    tmp_path: Path, qapp: QApplication, jpeg_blobs: dict[str, bytes]
+) -> None:
+    """Test that a recent successful fetch suppresses new fetches until mode changes."""
+    (tmp_path / "test.jpg").write_bytes(jpeg_blobs["blue"])
+    manager = WallpaperManager(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        local_folder_path=tmp_path,
+        use_online=False,
+    )
+    _join_fetch(manager)
+    assert manager._last_fetch_ts is not None
+
+    with patch("src.services.wallpaper.wallpaper.threading.Thread") as mock_thread:
+        assert manager.get_wallpaper() is not None
+        mock_thread.assert_not_called()
+
+        manager.set_use_online(False)
+        manager.get_wallpaper()
+        mock_thread.assert_called_once()
+
+
+def test_local_getter_rescans_only_when_folder_changes(tmp_path: Path) -> None:
+    """Test that the folder listing is reused until the folder mtime changes."""
+    (tmp_path / "first.jpg").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    (tmp_path / "folder.jpg").mkdir()
+    mtime_ns = tmp_path.stat().st_mtime_ns
+    getter = LocalWallpaperGetter(tmp_path)
+
+    with patch.object(local.os, "scandir", wraps=local.os.scandir) as mock_scandir:
+        assert getter.get_wallpaper() == tmp_path / "first.jpg"
+        assert getter.get_wallpaper() == tmp_path / "first.jpg"
+        assert mock_scandir.call_count == 1
+
+        (tmp_path / "first.jpg").unlink()
+        (tmp_path / "second.PNG").write_bytes(b"")
+
+        # Folder mtime pinned to the scanned value: the old listing is reused
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        assert getter.get_wallpaper() == tmp_path / "first.jpg"
+        assert mock_scandir.call_count == 1
+
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert getter.get_wallpaper() == tmp_path / "second.PNG"
+        assert mock_scandir.call_count == 2
+
+
+def test_picsum_getter_keeps_cache_on_failed_download(tmp_path: Path) -> None:
+    """Test that an interrupted download leaves the previous cache file intact."""
+    cache_path = tmp_path / "cache.jpg"
+    cache_path.write_bytes(b"previous")
+    _make_stale(cache_path)
+    getter = PicsumWallpaperGetter(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        cache_file_path=cache_path,
+    )
+    response = MagicMock()
+    response.iter_content.side_effect = requests.ConnectionError("reset")
+    response.__enter__.return_value = response
+
+    with patch.object(getter._session, "get", return_value=response):
+        assert getter.get_wallpaper() is None
+
+    assert cache_path.read_bytes() == b"previous"
+    assert not cache_path.with_suffix(".tmp").exists()
+
+
+def test_picsum_getter_skips_download_when_cache_fresh(tmp_path: Path) -> None:
+    """Test that a recently downloaded cache file is reused without a request."""
+    cache_path = tmp_path / "cache.jpg"
+    cache_path.write_bytes(b"fresh")
+    getter = PicsumWallpaperGetter(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        cache_file_path=cache_path,
+    )
+
+    with patch.object(getter._session, "get") as mock_get:
+        assert getter.get_wallpaper() == cache_path
+        mock_get.assert_not_called()
+
+
+def test_fetch_runs_in_daemon_thread(tmp_path: Path, qapp: QApplication) -> None:
+    """Test that a running download does not keep the process alive on exit."""
+    manager = WallpaperManager(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        local_folder_path=tmp_path,
+        use_online=False,
+    )
+    _join_fetch(manager)
+
+    assert manager._fetch_thread is not None
+    assert manager._fetch_thread.daemon
@@ -1,6 +1,11 @@
 """Tests for App orchestrator."""
 
+import threading
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import Qt
 from pytestqt.qtbot import QtBot
+from src.app import App, _HotkeyBridge
 from src.services.position import WidgetPosition, calculate_position
 from src.widgets.timer import TimerWidget
 
@@ -28,3 +33,34 @@ def test_timer_widget_positions_correctly(qtbot: QtBot) -> None:
         # Check position is within available screen bounds
         assert 0 <= pos.x() <= screen_width
         assert 0 <= pos.y() <= available_height
+
+
+def test_hotkey_bridge_delivers_to_gui_thread(qtbot: QtBot) -> None:
+    """Test that a hotkey fired from a hook thread runs its slot in the GUI thread."""
+    bridge = _HotkeyBridge()
+    called_in: list[threading.Thread] = []
+    bridge.move_timer_requested.connect(
+        lambda: called_in.append(threading.current_thread()),
+        Qt.ConnectionType.QueuedConnection,
+    )
+
+    hook_thread = threading.Thread(target=bridge.move_timer_requested.emit)
+    hook_thread.start()
+    hook_thread.join()
+
+    qtbot.waitUntil(lambda: bool(called_in))
+    assert called_in == [threading.main_thread()]
+
+
+def test_remove_hotkeys_unhooks_only_registered_hotkeys() -> None:
+    """Test that teardown unhooks keyboard once and only after registration."""
+    app = App.__new__(App)
+    app._keyboard = None
+    app.remove_hotkeys()
+
+    fake_keyboard = MagicMock()
+    app._keyboard = fake_keyboard
+    app.remove_hotkeys()
+    app.remove_hotkeys()
+
+    fake_keyboard.unhook_all.assert_called_once_with()
@@ -3,7 +3,7 @@
 from datetime import timedelta
 
 import pytest
-from src.utils.time import format_time
+from src.utils.time import format_seconds, format_time
 
 
 class TestFormatTime:
@@ -29,3 +29,12 @@ class TestFormatTime:
     def test_format_time_zero(self) -> None:
         """format_time форматирует нулевой timedelta."""
         assert format_time(timedelta(0)) == "00:00"
+
+    def test_format_time_truncates_fraction(self) -> None:
+        """format_time отбрасывает доли секунды."""
+        assert format_time(timedelta(seconds=119.9)) == "01:59"
+
+    @pytest.mark.parametrize("seconds", [0, 59, 2700, 3600, 3661])
+    def test_format_seconds_matches_format_time(self, seconds: int) -> None:
+        """format_seconds совпадает с format_time для целых секунд."""
+        assert format_seconds(seconds) == format_time(timedelta(seconds=seconds))
@@ -1,8 +1,8 @@
 """Тесты рендеринга фона."""
 
-from PySide6.QtCore import QRect
+from PySide6.QtCore import QRect, QSize
 from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
-from src.widgets.background import paint_background
+from src.widgets.background import paint_background, prepare_wallpaper
 
 
 class TestPaintBackground:
@@ -43,3 +43,54 @@ class TestPaintBackground:
 
         painter.end()
         assert not image.isNull()
+
+    def test_prepare_wallpaper_covers_size(self, qapp: None) -> None:
+        """prepare_wallpaper покрывает область с сохранением пропорций."""
+        wallpaper = QPixmap(200, 100)
+        wallpaper.fill(QColor("blue"))
+
+        scaled = prepare_wallpaper(wallpaper, QSize(100, 100))
+
+        assert scaled.size() == QSize(200, 100)
+        assert prepare_wallpaper(wallpaper, QSize(400, 100)).size() == QSize(400, 200)
+
+    def test_prepare_wallpaper_bakes_tint(self, qapp: None) -> None:
+        """prepare_wallpaper затемняет обои заранее, а не при отрисовке."""
+        wallpaper = QPixmap(10, 10)
+        wallpaper.fill(QColor("white"))
+
+        prepared = prepare_wallpaper(wallpaper, QSize(10, 10))
+
+        assert prepared.toImage().pixelColor(5, 5).lightness() < QColor("white").lightness()
+
+    def test_paint_prepared_wallpaper_as_is(self, qapp: None) -> None:
+        """paint_background рисует подготовленные обои без повторной обработки."""
+        image = QImage(10, 10, QImage.Format.Format_ARGB32)
+        painter = QPainter(image)
+        wallpaper = QPixmap(10, 10)
+        wallpaper.fill(QColor("white"))
+
+        paint_background(painter, QRect(0, 0, 10, 10), wallpaper, prepared=True)
+
+        painter.end()
+        assert image.pixelColor(5, 5) == QColor("white")
+
+    def test_paint_only_exposed_rect(self, qapp: None) -> None:
+        """paint_background не трогает пиксели вне перерисовываемой области."""
+        image = QImage(20, 20, QImage.Format.Format_ARGB32)
+        image.fill(QColor("red"))
+        painter = QPainter(image)
+        wallpaper = QPixmap(20, 20)
+        wallpaper.fill(QColor("white"))
+
+        paint_background(
+            painter,
+            QRect(0, 0, 20, 20),
+            wallpaper,
+            prepared=True,
+            exposed=QRect(0, 0, 10, 10),
+        )
+
+        painter.end()
+        assert image.pixelColor(5, 5) == QColor("white")
+        assert image.pixelColor(15, 15) == QColor("red")
@@ -1,21 +1,32 @@
 """Tests for overlay widget."""
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
-from PySide6.QtGui import QCloseEvent
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCloseEvent, QColor, QPixmap, QShowEvent
+from PySide6.QtTest import QSignalSpy
 from pytestqt.qtbot import QtBot
 from src.constants.settings import MAX_FOCUS_LENGTH, PRELOAD_HEIGHT_DEFAULT, PRELOAD_WIDTH_DEFAULT
 from src.widgets.overlay import BlockingOverlay
 
+_MAX_TEXT = "A" * MAX_FOCUS_LENGTH
 
-def test_overlay_blocks_close_when_blocking(qtbot: QtBot) -> None:
-    """Test that overlay blocks close event when blocking mode is active."""
-    overlay = BlockingOverlay(
+
+@pytest.fixture
+def overlay(qtbot: QtBot) -> BlockingOverlay:
+    """Create an overlay sized to the default preload resolution."""
+    widget = BlockingOverlay(
         screen_width=PRELOAD_WIDTH_DEFAULT,
         screen_height=PRELOAD_HEIGHT_DEFAULT,
     )
-    qtbot.addWidget(overlay)
+    qtbot.addWidget(widget)
+    return widget
 
+
+def test_overlay_blocks_close_when_blocking(overlay: BlockingOverlay) -> None:
+    """Test that overlay blocks close event when blocking mode is active."""
     # Set blocking mode
     overlay.is_blocking = True
 
@@ -27,57 +38,35 @@ def test_overlay_blocks_close_when_blocking(qtbot: QtBot) -> None:
     assert not event.isAccepted()
 
 
-def test_overlay_emits_close_signal_when_not_blocking(qtbot: QtBot) -> None:
+def test_overlay_emits_close_signal_when_not_blocking(overlay: BlockingOverlay) -> None:
     """Test that overlay emits close signal when blocking mode is not active."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
-
     # Set non-blocking mode
     overlay.is_blocking = False
 
-    # Monitor signal
-    with qtbot.waitSignal(overlay.close_requested, timeout=1000):
-        event = QCloseEvent()
-        overlay.closeEvent(event)
+    # closeEvent emits synchronously, so no event loop is needed
+    spy = QSignalSpy(overlay.close_requested)
+    event = QCloseEvent()
+    overlay.closeEvent(event)
 
+    assert spy.count() == 1
     # Event should be accepted
     assert event.isAccepted()
 
 
-def test_overlay_default_is_not_blocking() -> None:
+def test_overlay_default_is_not_blocking(overlay: BlockingOverlay) -> None:
     """Test that overlay defaults to non-blocking mode."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-
     assert overlay.is_blocking is False
 
 
-def test_overlay_hide_focus_input(qtbot: QtBot) -> None:
+def test_overlay_hide_focus_input(overlay: BlockingOverlay) -> None:
     """Test hiding focus input field."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
-
     overlay.hide_focus_input()
 
     assert not overlay.focus_input.isVisible()
 
 
-def test_overlay_show_focus_input(qtbot: QtBot) -> None:
+def test_overlay_show_focus_input(overlay: BlockingOverlay) -> None:
     """Test showing focus input field."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
-
     # Show widget to make visibility checks work
     overlay.show()
 
@@ -87,14 +76,8 @@ def test_overlay_show_focus_input(qtbot: QtBot) -> None:
     assert overlay.focus_input.isVisible()
 
 
-def test_overlay_hide_extra_rest_timer(qtbot: QtBot) -> None:
+def test_overlay_hide_extra_rest_timer(overlay: BlockingOverlay) -> None:
     """Test hiding extra rest timer."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
-
     overlay.show_extra_rest_timer(datetime.now(UTC))
     overlay.hide_extra_rest_timer()
 
@@ -103,25 +86,10 @@ def test_overlay_hide_extra_rest_timer(qtbot: QtBot) -> None:
     assert overlay.extra_rest_start is None
 
 
-def test_overlay_focus_input_has_fixed_width(qtbot: QtBot) -> None:
-    """Test that focus input has a calculated fixed width."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
-
-    # Focus input should have a fixed width greater than 0
-    assert overlay.focus_input.width() > 0
-
-
-def test_overlay_focus_input_has_reasonable_width(qtbot: QtBot) -> None:
-    """Test that focus input has reasonable width boundaries."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
+def test_overlay_focus_input_properties(overlay: BlockingOverlay) -> None:
+    """Test focus input width and length limits on one overlay."""
+    # None of these checks mutate state the others depend on, so they share
+    # one widget instead of building an overlay per assertion.
 
     # Width should be within reasonable bounds
     # Minimum: at least 300px to show some text
@@ -131,33 +99,102 @@ def test_overlay_focus_input_has_reasonable_width(qtbot: QtBot) -> None:
     width = overlay.focus_input.width()
     assert min_width <= width <= max_width
 
+    assert overlay.focus_input.maxLength() == MAX_FOCUS_LENGTH
 
-def test_overlay_focus_input_accepts_max_length_text(qtbot: QtBot) -> None:
-    """Test that focus input can accept MAX_FOCUS_LENGTH characters."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
-    )
-    qtbot.addWidget(overlay)
+    # Maximum-length text is kept whole, the extra character is rejected
+    overlay.focus_input.setText(_MAX_TEXT + "B")
+    assert overlay.focus_input.text() == _MAX_TEXT
 
-    # Create text of maximum length
-    max_text = "A" * MAX_FOCUS_LENGTH
 
-    # Set text and verify it was accepted
-    overlay.focus_input.setText(max_text)
-    assert overlay.focus_input.text() == max_text
+def test_overlay_reuses_scaled_wallpaper(overlay: BlockingOverlay) -> None:
+    """Test that the wallpaper is rescaled only when the window size changes."""
+    wallpaper = QPixmap(64, 32)
+    wallpaper.fill(QColor("blue"))
+    overlay._current_wallpaper = wallpaper
+    overlay.resize(100, 100)
 
-    # Try to add one more character - should be rejected
-    overlay.focus_input.setText(max_text + "B")
-    assert overlay.focus_input.text() == max_text
+    first = overlay._get_scaled_wallpaper()
+    assert first is not None
+    assert overlay._get_scaled_wallpaper() is first
 
+    overlay.resize(200, 200)
+    resized = overlay._get_scaled_wallpaper()
+    assert resized is not first
+    assert resized is not None
+    assert resized.height() == 200
 
-def test_overlay_focus_input_respects_max_length(qtbot: QtBot) -> None:
-    """Test that focus input respects MAX_FOCUS_LENGTH setting."""
-    overlay = BlockingOverlay(
-        screen_width=PRELOAD_WIDTH_DEFAULT,
-        screen_height=PRELOAD_HEIGHT_DEFAULT,
+    other = QPixmap(64, 32)
+    other.fill(QColor("red"))
+    overlay._current_wallpaper = other
+    assert overlay._get_scaled_wallpaper() is not resized
+
+
+def test_overlay_extra_rest_timer_skips_unchanged_text(overlay: BlockingOverlay) -> None:
+    """Test that the extra rest label is not updated when the text is the same."""
+    overlay.show_extra_rest_timer(datetime.now(UTC))
+    text = overlay.extra_rest_label.text()
+    assert text.endswith("+00:00")
+
+    with patch.object(overlay.extra_rest_label, "setText") as mock_set_text:
+        overlay._update_extra_rest_timer()
+        mock_set_text.assert_not_called()
+
+    overlay.hide_extra_rest_timer()
+
+
+def test_overlay_creates_wallpaper_manager_on_first_show(overlay: BlockingOverlay) -> None:
+    """Test that the wallpaper manager is created lazily with the saved setting."""
+    overlay.set_use_online_wallpapers(False)
+    assert overlay.wallpaper_manager is None
+
+    with patch("src.widgets.overlay.WallpaperManager") as mock_manager:
+        overlay.showEvent(QShowEvent())
+
+    mock_manager.assert_called_once_with(
+        width=PRELOAD_WIDTH_DEFAULT,
+        height=PRELOAD_HEIGHT_DEFAULT,
+        use_online=False,
     )
-    qtbot.addWidget(overlay)
+    assert overlay.wallpaper_manager is mock_manager.return_value
 
-    assert overlay.focus_input.maxLength() == MAX_FOCUS_LENGTH
+
+def test_overlay_upgrades_fast_scaled_wallpaper(overlay: BlockingOverlay) -> None:
+    """Test that the fast first scale is replaced by a smooth one."""
+    wallpaper = QPixmap(64, 32)
+    wallpaper.fill(QColor("blue"))
+    overlay._current_wallpaper = wallpaper
+    overlay.resize(100, 100)
+
+    fast = overlay._get_scaled_wallpaper()
+    overlay._upgrade_wallpaper_quality()
+    smooth = overlay._get_scaled_wallpaper()
+
+    assert smooth is not fast
+    assert smooth is not None
+    assert smooth.height() == 100
+
+
+def test_overlay_set_text_skips_unchanged_text(overlay: BlockingOverlay) -> None:
+    """Test that setting the same text again does not touch the label."""
+    overlay.set_text("Break: 05:00")
+
+    with patch.object(overlay.label, "setText") as mock_set_text:
+        overlay.set_text("Break: 05:00")
+        mock_set_text.assert_not_called()
+        overlay.set_text("Break: 04:59")
+        mock_set_text.assert_called_once_with("Break: 04:59")
+
+
+def test_overlay_opaque_paint_only_with_opaque_wallpaper(overlay: BlockingOverlay) -> None:
+    """Test that background erasing is skipped only when the wallpaper covers everything."""
+    wallpaper = QPixmap(64, 32)
+    wallpaper.fill(QColor("blue"))
+
+    with patch("src.widgets.overlay.WallpaperManager") as mock_manager:
+        mock_manager.return_value.get_wallpaper.return_value = wallpaper
+        overlay.showEvent(QShowEvent())
+        assert overlay.testAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        mock_manager.return_value.get_wallpaper.return_value = None
+        overlay.showEvent(QShowEvent())
+        assert not overlay.testAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
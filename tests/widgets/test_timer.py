@@ -1,11 +1,12 @@
 """Tests for timer widget."""
 
 from datetime import timedelta
+from unittest.mock import patch
 
+import pytest
 from PySide6.QtCore import Qt
 from pytestqt.qtbot import QtBot
 from src.constants.settings import MAX_FOCUS_LENGTH, RED_SECOND_THRESHOLD
-from src.widgets.styles import TIMER_TIME_RED_STYLE
 from src.widgets.timer import TimerWidget
 
 
@@ -38,7 +39,7 @@ def test_update_time_turns_red_under_threshold(qtbot: QtBot) -> None:
 
     widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 1))
 
-    assert TIMER_TIME_RED_STYLE in widget.time_label.styleSheet()
+    assert widget.time_label.property("state") == "red"
 
 
 def test_timer_has_fixed_width(qtbot: QtBot) -> None:
@@ -57,17 +58,24 @@ def test_timer_has_fixed_width(qtbot: QtBot) -> None:
     assert widget.width() > 0
 
 
-def test_focus_text_within_widget_bounds(qtbot: QtBot) -> None:
-    """Test that focus text is within widget bounds."""
+@pytest.fixture
+def shown_widget(qtbot: QtBot) -> TimerWidget:
+    """Create a shown timer widget for a focus geometry case."""
     widget = TimerWidget()
     qtbot.addWidget(widget)
     widget.show()
+    return widget
 
-    widget.set_focus_text("Только Флеред")
 
-    # Focus label should be visible and within widget geometry
-    assert widget.focus_label.isVisible()
-    assert widget.focus_label.geometry().bottom() <= widget.height()
+@pytest.mark.parametrize("focus", ["Только Флеред", "A" * MAX_FOCUS_LENGTH])
+def test_focus_text_within_widget_bounds(shown_widget: TimerWidget, focus: str) -> None:
+    """Test that focus text is visible and within widget bounds."""
+    shown_widget.set_focus_text(focus)
+
+    assert shown_widget.focus_label.isVisible()
+    focus_geometry = shown_widget.focus_label.geometry()
+    assert focus_geometry.right() <= shown_widget.width()
+    assert focus_geometry.bottom() <= shown_widget.height()
 
 
 def test_timer_has_translucent_background(qtbot: QtBot) -> None:
@@ -78,18 +86,64 @@ def test_timer_has_translucent_background(qtbot: QtBot) -> None:
     assert widget.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
 
-def test_timer_size_based_on_max_focus_length(qtbot: QtBot) -> None:
-    """Test that timer size accommodates MAX_FOCUS_LENGTH."""
+def test_update_time_restyles_only_on_transition(qtbot: QtBot) -> None:
+    """Test that the label is re-polished only when the red state changes."""
+    widget = TimerWidget()
+    qtbot.addWidget(widget)
+
+    with patch.object(widget.time_label, "setProperty") as mock_set_property:
+        widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD + 10))
+        widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD + 9))
+        mock_set_property.assert_not_called()
+
+        widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 1))
+        widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 2))
+        mock_set_property.assert_called_once_with("state", "red")
+
+
+def test_update_time_never_reparses_stylesheet(qtbot: QtBot) -> None:
+    """Test that switching to red does not set a new stylesheet."""
+    widget = TimerWidget()
+    qtbot.addWidget(widget)
+
+    with patch.object(widget.time_label, "setStyleSheet") as mock_set_style:
+        widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 1))
+        mock_set_style.assert_not_called()
+
+
+def test_reset_style_clears_red_state(qtbot: QtBot) -> None:
+    """Test that after reset the next red tick restyles the label again."""
+    widget = TimerWidget()
+    qtbot.addWidget(widget)
+    widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 1))
+
+    widget.reset_style()
+    assert widget.time_label.property("state") == "normal"
+
+    widget.update_time(timedelta(seconds=RED_SECOND_THRESHOLD - 1))
+    assert widget.time_label.property("state") == "red"
+
+
+def test_set_focus_text_skips_unchanged_text(qtbot: QtBot) -> None:
+    """Test that setting the same focus again does not resize the widget."""
+    widget = TimerWidget()
+    qtbot.addWidget(widget)
+    widget.set_focus_text("focus")
+
+    with patch.object(widget, "adjustSize") as mock_adjust:
+        widget.set_focus_text("focus")
+        mock_adjust.assert_not_called()
+
+
+def test_rounded_path_rebuilt_only_on_resize(qtbot: QtBot) -> None:
+    """Test that the background shape is reused until the widget is resized."""
     widget = TimerWidget()
     qtbot.addWidget(widget)
-    widget.show()
 
-    # Set focus with MAX_FOCUS_LENGTH characters
-    max_focus = "A" * MAX_FOCUS_LENGTH
-    widget.set_focus_text(max_focus)
+    path = widget._get_rounded_path()
+    assert widget._get_rounded_path() is path
 
-    # Focus label should be fully visible within widget bounds
-    assert widget.focus_label.isVisible()
-    focus_geometry = widget.focus_label.geometry()
-    assert focus_geometry.right() <= widget.width()
-    assert focus_geometry.bottom() <= widget.height()
+    widget.resize(widget.width() + 10, widget.height())
+    resized = widget._get_rounded_path()
+    assert resized is not path
+    assert resized.boundingRect().width() == widget.width()
@@ -1,88 +1,70 @@
 """Tests for welcome dialog widget."""
 
-from pytestqt.qtbot import QtBot
+from collections.abc import Iterator
+
+import pytest
+from PySide6.QtWidgets import QAbstractButton, QApplication
 from src.constants.settings import POMODORO_MODE_MIN, STANDARD_MODE_MIN
 from src.widgets.welcome import WelcomeDialog
 
 
-def test_welcome_dialog_creation(qtbot: QtBot) -> None:
-    """Test that welcome dialog is created successfully."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
-
-    assert dialog is not None
-    assert dialog.windowTitle() == "Take Break"
-
-
-def test_welcome_dialog_has_radio_buttons(qtbot: QtBot) -> None:
-    """Test that welcome dialog has work mode radio buttons."""
+@pytest.fixture(scope="module")
+def welcome_dialog(qapp: QApplication) -> Iterator[WelcomeDialog]:
+    """Create one welcome dialog for the whole module."""
     dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
-
-    # Radio buttons should exist
-    assert dialog.radio_25 is not None
-    assert dialog.radio_45 is not None
+    yield dialog
+    dialog.close()
+    dialog.deleteLater()
 
-    # 45 minutes should be checked by default
-    assert dialog.radio_45.isChecked()
-    assert not dialog.radio_25.isChecked()
 
+@pytest.fixture(scope="module")
+def _initial_button(welcome_dialog: WelcomeDialog) -> QAbstractButton:
+    """Capture the button the dialog checks in its constructor."""
+    button = welcome_dialog.work_mode_group.checkedButton()
+    assert button is not None
+    return button
 
-def test_welcome_dialog_default_selection(qtbot: QtBot) -> None:
-    """Test that default work duration is 45 minutes."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
 
-    selected_duration = dialog.get_selected_work_duration()
-    assert selected_duration == STANDARD_MODE_MIN
+@pytest.fixture(autouse=True)
+def _reset_welcome(_initial_button: QAbstractButton) -> None:
+    """Restore the constructor's selection before each test."""
+    _initial_button.setChecked(True)
 
 
-def test_welcome_dialog_select_25_minutes(qtbot: QtBot) -> None:
-    """Test selecting 25 minutes (Pomodoro) mode."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
-
-    # Select 25 minutes
-    dialog.radio_25.setChecked(True)
+def test_welcome_dialog_creation(welcome_dialog: WelcomeDialog) -> None:
+    """Test that welcome dialog is created successfully."""
+    assert welcome_dialog is not None
+    assert welcome_dialog.windowTitle() == "Take Break"
 
-    selected_duration = dialog.get_selected_work_duration()
-    assert selected_duration == POMODORO_MODE_MIN
 
+def test_welcome_dialog_default_selection(welcome_dialog: WelcomeDialog) -> None:
+    """Test that an untouched dialog selects 45 minutes by default."""
+    assert welcome_dialog.radio_45.isChecked()
+    assert not welcome_dialog.radio_25.isChecked()
+    assert welcome_dialog.get_selected_work_duration() == STANDARD_MODE_MIN
 
-def test_welcome_dialog_select_45_minutes(qtbot: QtBot) -> None:
-    """Test selecting 45 minutes (Standard) mode."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
 
-    # Ensure 45 minutes is selected (should be default)
-    dialog.radio_45.setChecked(True)
+@pytest.mark.parametrize(
+    ("radio_attr", "other_attr", "expected"),
+    [
+        ("radio_25", "radio_45", POMODORO_MODE_MIN),
+        ("radio_45", "radio_25", STANDARD_MODE_MIN),
+    ],
+)
+def test_welcome_dialog_selected_duration(
+    welcome_dialog: WelcomeDialog, radio_attr: str, other_attr: str, expected: int
+) -> None:
+    """Test that switching to a mode radio button selects its duration."""
+    # Start from the other mode so each case is a real switch
+    getattr(welcome_dialog, other_attr).setChecked(True)
+    getattr(welcome_dialog, radio_attr).setChecked(True)
 
-    selected_duration = dialog.get_selected_work_duration()
-    assert selected_duration == STANDARD_MODE_MIN
+    assert welcome_dialog.get_selected_work_duration() == expected
+    assert not getattr(welcome_dialog, other_attr).isChecked()
 
 
-def test_welcome_dialog_button_group(qtbot: QtBot) -> None:
+def test_welcome_dialog_button_group(welcome_dialog: WelcomeDialog) -> None:
     """Test that only one radio button can be selected at a time."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
-
     # Both buttons should be in the same button group
-    assert dialog.radio_25.group() == dialog.radio_45.group()
-    assert dialog.radio_25.group() == dialog.work_mode_group
-
-
-def test_welcome_dialog_switching_between_modes(qtbot: QtBot) -> None:
-    """Test switching between 25 and 45 minute modes."""
-    dialog = WelcomeDialog()
-    qtbot.addWidget(dialog)
-
-    # Start with 45 minutes (default)
-    assert dialog.get_selected_work_duration() == STANDARD_MODE_MIN
-
-    # Switch to 25 minutes
-    dialog.radio_25.setChecked(True)
-    assert dialog.get_selected_work_duration() == POMODORO_MODE_MIN
-
-    # Switch back to 45 minutes
-    dialog.radio_45.setChecked(True)
-    assert dialog.get_selected_work_duration() == STANDARD_MODE_MIN
+    assert welcome_dialog.radio_25.group() == welcome_dialog.radio_45.group()
+    assert welcome_dialog.radio_25.group() == welcome_dialog.work_mode_group